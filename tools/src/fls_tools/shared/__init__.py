@@ -64,6 +64,9 @@ from .paths import (
     # Other shared paths
     get_concept_to_fls_path,
     get_misra_rust_applicability_path,
+    get_encode_cache_path,
+    get_fls_ids_cache_path,
+    get_standards_validation_cache_path,
     # Path resolution and validation
     resolve_path,
     validate_path_in_project,
@@ -85,6 +88,13 @@ from .io import (
     load_json,
     save_json,
     load_embeddings,
+    EMBEDDING_FORMATS,
+    embeddings_exist,
+    read_embeddings_file,
+    write_embeddings_file,
+    EMBEDDING_DTYPES,
+    quantize_embeddings,
+    decode_embeddings,
 )
 
 from .fls import (
@@ -114,6 +124,7 @@ from .schema_version import (
     is_v3,
     is_v3_2,
     is_v4,
+    is_v1_version,
     is_v1_family,
     is_v2_family,
     is_grandfather_version,
@@ -148,6 +159,7 @@ from .fls_ids import (
     get_valid_fls_ids_path,
     generate_valid_fls_ids,
     load_valid_fls_ids,
+    scan_rst_fls_ids,
     validate_fls_id,
 )
 
@@ -199,6 +211,9 @@ __all__ = [
     # paths - other shared
     "get_concept_to_fls_path",
     "get_misra_rust_applicability_path",
+    "get_encode_cache_path",
+    "get_fls_ids_cache_path",
+    "get_standards_validation_cache_path",
     # paths - resolution and validation
     "resolve_path",
     "validate_path_in_project",
@@ -216,6 +231,13 @@ __all__ = [
     "load_json",
     "save_json",
     "load_embeddings",
+    "EMBEDDING_FORMATS",
+    "embeddings_exist",
+    "read_embeddings_file",
+    "write_embeddings_file",
+    "EMBEDDING_DTYPES",
+    "quantize_embeddings",
+    "decode_embeddings",
     # fls
     "load_fls_chapters",
     "build_fls_metadata",
@@ -237,6 +259,7 @@ __all__ = [
     "is_v3",
     "is_v3_2",
     "is_v4",
+    "is_v1_version",
     "is_v1_family",
     "is_v2_family",
     "is_grandfather_version",
@@ -269,5 +292,6 @@ __all__ = [
     "get_valid_fls_ids_path",
     "generate_valid_fls_ids",
     "load_valid_fls_ids",
+    "scan_rst_fls_ids",
     "validate_fls_id",
 ]
@@ -16,6 +16,9 @@ automatically when extract-fls-content is run.
 """
 
 import json
+import mmap
+import os
+import re
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -27,6 +30,10 @@ from .paths import (
     get_synthetic_fls_ids_path,
 )
 
+# Any FLS ID in RST source (anchors, :dp: roles, references); IDs are ASCII,
+# so files are scanned as raw bytes without decoding
+FLS_ID_IN_RST_PATTERN = re.compile(rb"fls_[a-zA-Z0-9]+")
+
 
 def get_valid_fls_ids_path(root: Path | None = None) -> Path:
     """Get the path to the valid FLS IDs file."""
@@ -35,6 +42,29 @@ def get_valid_fls_ids_path(root: Path | None = None) -> Path:
     return get_data_dir(root) / "valid_fls_ids.json"
 
 
+def scan_rst_fls_ids(rst_dir: Path) -> set[str]:
+    """
+    Collect every FLS ID mentioned in the FLS RST sources (*.rst in rst_dir).
+    
+    Returns an empty set if the directory does not exist.
+    """
+    ids: set[bytes] = set()
+    if not rst_dir.exists():
+        return set()
+    
+    for rst_file in rst_dir.glob("*.rst"):
+        with open(rst_file, "rb") as f:
+            # mmap rejects empty files
+            if os.fstat(f.fileno()).st_size == 0:
+                continue
+            # Search the page-cached mapping directly instead of copying the file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                ids.update(FLS_ID_IN_RST_PATTERN.findall(mm))
+    
+    # Decode each distinct ID once
+    return {fls_id.decode("ascii") for fls_id in ids}
+
+
 def extract_ids_from_section_mapping(root: Path) -> set[str]:
     """
     Extract all FLS IDs from fls_section_mapping.json.
@@ -45,22 +75,14 @@ def extract_ids_from_section_mapping(root: Path) -> set[str]:
     if not mapping_path.exists():
         return set()
     
-    with open(mapping_path) as f:
-        mapping = json.load(f)
-    
     ids = set()
     
-    def extract_recursive(obj: dict | list) -> None:
-        if isinstance(obj, dict):
-            if "fls_id" in obj and obj["fls_id"]:
-                ids.add(obj["fls_id"])
-            for value in obj.values():
-                extract_recursive(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                extract_recursive(item)
-    
-    extract_recursive(mapping)
+    def extract_id(obj: dict) -> None:
+        if obj.get("fls_id"):
+            ids.add(obj["fls_id"])
+    
+    # Collect IDs as each object is decoded instead of walking the tree after
+    json.loads(mapping_path.read_bytes(), object_hook=extract_id)
     return ids
 
 
@@ -64,6 +64,146 @@ def save_json(
         f.write("\n")  # Add trailing newline
 
 
+# Storage dtypes supported for embedding arrays in the pickles
+EMBEDDING_DTYPES = ("float32", "float16", "int8")
+
+
+def quantize_embeddings(
+    embeddings: np.ndarray,
+    dtype: str = "float32",
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Convert float embeddings to a storage dtype.
+    
+    Args:
+        embeddings: numpy array of embeddings (N x D)
+        dtype: One of EMBEDDING_DTYPES. int8 uses a symmetric per-row scale.
+    
+    Returns:
+        Tuple of:
+        - The embeddings in the storage dtype
+        - Per-row scale (N x 1, float32) for int8, otherwise None
+    """
+    if dtype == "float32":
+        return embeddings.astype(np.float32, copy=False), None
+    if dtype == "float16":
+        return embeddings.astype(np.float16), None
+    if dtype == "int8":
+        scale = np.abs(embeddings).max(axis=1, keepdims=True).astype(np.float32) / 127
+        scale[scale == 0] = 1.0  # all-zero rows stay zero
+        return np.round(embeddings / scale).astype(np.int8), scale
+    raise ValueError(f"Unsupported embedding dtype: {dtype}")
+
+
+def decode_embeddings(embed_data: dict) -> np.ndarray:
+    """
+    Get the float32 embeddings array from a pickle's 'data' dict.
+    
+    Undoes quantize_embeddings(): float16 arrays are widened and int8 arrays
+    are rescaled with the stored 'embedding_scale'.
+    """
+    embeddings = embed_data.get("embeddings", np.array([]))
+    scale = embed_data.get("embedding_scale")
+    if scale is not None:
+        return embeddings.astype(np.float32) * scale
+    if embeddings.dtype == np.float16:
+        return embeddings.astype(np.float32)
+    return embeddings
+
+
+# On-disk layouts for embeddings files. "npy" stores the array as a sibling
+# .npy (memory-mapped on load) with everything else in a .meta.json.
+EMBEDDING_FORMATS = ("pickle", "npy")
+
+
+def _npy_sibling_paths(path: Path) -> tuple[Path, Path]:
+    """Get the .npy and .meta.json paths that stand in for an embeddings .pkl."""
+    return path.with_suffix(".npy"), path.with_suffix(".meta.json")
+
+
+def embeddings_exist(path: Path) -> bool:
+    """Check whether an embeddings file exists in either on-disk format."""
+    npy_path, meta_path = _npy_sibling_paths(path)
+    return path.exists() or (npy_path.exists() and meta_path.exists())
+
+
+def read_embeddings_file(path: Path) -> dict:
+    """
+    Read an embeddings file into the pickle layout.
+    
+    If the .npy/.meta.json pair for `path` exists it is preferred and the
+    array is memory-mapped read-only; otherwise `path` is unpickled.
+    'id_to_index' is not stored by generate_embeddings.py and is rebuilt
+    from 'ids' when missing.
+    
+    Args:
+        path: Path to the embeddings .pkl file
+    
+    Returns:
+        Dict with 'data' ('ids', 'embeddings', 'id_to_index') and header fields
+    """
+    npy_path, meta_path = _npy_sibling_paths(path)
+    if npy_path.exists() and meta_path.exists():
+        with open(meta_path, encoding="utf-8") as f:
+            output = json.load(f)
+        data = output["data"]
+        data["embeddings"] = np.load(npy_path, mmap_mode="r")
+        if "embedding_scale" in data:
+            data["embedding_scale"] = np.asarray(data["embedding_scale"], dtype=np.float32).reshape(-1, 1)
+    else:
+        with open(path, "rb") as f:
+            output = pickle.load(f)
+        data = output.get("data", output)
+    
+    if "id_to_index" not in data:
+        data["id_to_index"] = {id_: i for i, id_ in enumerate(data.get("ids", []))}
+    return output
+
+
+def write_embeddings_file(
+    path: Path,
+    output: dict,
+    fmt: str = "pickle",
+) -> list[Path]:
+    """
+    Write an embeddings dict (pickle layout) in one of EMBEDDING_FORMATS.
+    
+    Files of the other format for the same `path` are removed so that
+    read_embeddings_file() never picks up stale data.
+    
+    Args:
+        path: Path to the embeddings .pkl file
+        output: Dict with 'data' ('ids', 'embeddings', ...) and header fields
+        fmt: "pickle" writes `path`; "npy" writes the .npy/.meta.json pair
+    
+    Returns:
+        List of files written
+    """
+    npy_path, meta_path = _npy_sibling_paths(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if fmt == "pickle":
+        with open(path, "wb") as f:
+            pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+        npy_path.unlink(missing_ok=True)
+        meta_path.unlink(missing_ok=True)
+        return [path]
+    if fmt != "npy":
+        raise ValueError(f"Unsupported embeddings format: {fmt}")
+    
+    data = output["data"]
+    meta_data = {"ids": data["ids"]}
+    if data.get("embedding_scale") is not None:
+        meta_data["embedding_scale"] = data["embedding_scale"].ravel().tolist()
+    meta = {k: v for k, v in output.items() if k != "data"}
+    meta["data"] = meta_data
+    
+    np.save(npy_path, data["embeddings"])
+    save_json(meta_path, meta, indent=None)
+    path.unlink(missing_ok=True)
+    return [npy_path, meta_path]
+
+
 def load_embeddings(
     path: Path,
     exit_on_error: bool = True,
@@ -85,21 +225,20 @@ def load_embeddings(
         - id_to_index: Dict mapping ID to index in the array
         - metadata: Dict of additional metadata (if present)
     """
-    if not path.exists():
+    if not embeddings_exist(path):
         if exit_on_error:
             print(f"ERROR: Embeddings not found: {path}", file=sys.stderr)
             sys.exit(1)
         return [], np.array([]), {}, {}
     
-    with open(path, "rb") as f:
-        data = pickle.load(f)
+    data = read_embeddings_file(path)
     
     # Handle the embeddings format: data may be nested under 'data' key
     embed_data = data.get("data", data)
     
     return (
         embed_data.get("ids", []),
-        embed_data.get("embeddings", np.array([])),
+        decode_embeddings(embed_data),
         embed_data.get("id_to_index", {}),
         data.get("metadata", {}),
     )
@@ -128,7 +267,6 @@ def save_embeddings(
         "data": {
             "ids": ids,
             "embeddings": embeddings,
-            "id_to_index": {id_: i for i, id_ in enumerate(ids)},
         },
         **extra_fields,
     }
@@ -137,4 +275,4 @@ def save_embeddings(
         data["metadata"] = metadata
     
     with open(path, "wb") as f:
-        pickle.dump(data, f)
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
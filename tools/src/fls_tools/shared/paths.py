@@ -522,6 +522,32 @@ def get_misra_rust_applicability_path(root: Path | None = None) -> Path:
     return get_coding_standards_dir(root) / "misra_rust_applicability.json"
 
 
+def get_encode_cache_path(root: Path | None = None, model: str = "") -> Path:
+    """
+    Get the path to the text -> embedding cache for a sentence-transformers model.
+    
+    Args:
+        root: Project root (defaults to get_project_root())
+        model: Model name (e.g., all-mpnet-base-v2 or org/model)
+    
+    Returns:
+        Path like cache/encode_cache/all-mpnet-base-v2.pkl
+    """
+    if not model:
+        raise ValueError("model parameter is required")
+    return get_cache_dir(root) / "encode_cache" / f"{model.replace('/', '__')}.pkl"
+
+
+def get_fls_ids_cache_path(root: Path | None = None) -> Path:
+    """Get the path to the cached FLS ID sets used by validate-standards."""
+    return get_cache_dir(root) / "fls_ids.pkl"
+
+
+def get_standards_validation_cache_path(root: Path | None = None) -> Path:
+    """Get the path to the results of files that last passed validate-standards."""
+    return get_cache_dir(root) / "standards_validation.pkl"
+
+
 # =============================================================================
 # Path safety utilities
 # =============================================================================
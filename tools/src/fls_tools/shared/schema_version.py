@@ -67,9 +67,14 @@ def is_v3(data: Dict[str, Any]) -> bool:
     return str(detect_schema_version(data)).startswith("3.")
 
 
+def is_v1_version(version: str) -> bool:
+    """Check if a schema version string is v1 family (v1.0, v1.1, v1.2)."""
+    return str(version).startswith("1.")
+
+
 def is_v1_family(data: Dict[str, Any]) -> bool:
     """Check if data is v1 family (v1.0, v1.1, v1.2 - flat structure)."""
-    return str(detect_schema_version(data)).startswith("1.")
+    return is_v1_version(detect_schema_version(data))
 
 
 def is_v2_family(data: Dict[str, Any]) -> bool:
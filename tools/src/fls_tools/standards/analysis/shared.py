@@ -10,6 +10,7 @@ This module provides:
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -146,6 +147,26 @@ def load_json_file(path: Path) -> dict | None:
         return json.load(f)
 
 
+@lru_cache(maxsize=4096)
+def _load_json_file_cached(path_str: str, mtime_ns: int, size: int) -> dict | None:
+    """Parse a JSON file; mtime/size are part of the cache key so edits invalidate it."""
+    return load_json_file(Path(path_str))
+
+
+def load_json_file_readonly(path: Path) -> dict | None:
+    """
+    Load a JSON file through a cache keyed on path, mtime and size.
+    
+    The returned dict is shared between callers and must not be mutated.
+    Returns None if the file is not found.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return _load_json_file_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
 def save_json_file(path: Path, data: dict, indent: int = 2) -> None:
     """Save data to a JSON file."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -680,6 +701,10 @@ def check_pattern_conformance(decision: dict, batch: int) -> bool:
 # Review State Helpers
 # =============================================================================
 
+# Human review decision -> summary counter key (anything else counts as pending)
+_DECISION_COUNT_KEYS = {"accept": "accepted", "reject": "rejected"}
+
+
 def recompute_review_summary(root: Path | None = None) -> dict:
     """
     Recompute review summary by scanning all outlier analysis files.
@@ -713,8 +738,19 @@ def recompute_review_summary(root: Path | None = None) -> dict:
     if not outlier_dir.exists():
         return summary
     
+    # Bind the counter dicts once; each decision then costs a single increment
+    by_aspect = summary["by_aspect"]
+    categorization_counts = by_aspect["categorization"]
+    specificity_counts = by_aspect["specificity"]
+    add6_counts = by_aspect["add6_divergence"]
+    fls_counts = {
+        "fls_removals": by_aspect["fls_removals"],
+        "fls_additions": by_aspect["fls_additions"],
+    }
+    
     for f in outlier_dir.glob("*.json"):
-        outlier = load_json_file(f)
+        # Outliers are only read here, so unchanged files can come from the cache
+        outlier = load_json_file_readonly(f)
         if not outlier:
             continue
         
@@ -736,68 +772,26 @@ def recompute_review_summary(root: Path | None = None) -> dict:
         # Count by aspect
         cat = human_review.get("categorization", {})
         if cat:
-            dec = cat.get("decision")
-            if dec == "accept":
-                summary["by_aspect"]["categorization"]["accepted"] += 1
-            elif dec == "reject":
-                summary["by_aspect"]["categorization"]["rejected"] += 1
-            else:
-                summary["by_aspect"]["categorization"]["pending"] += 1
-        
-        # FLS removals - per-context structure: {fls_id: {contexts: [...], decisions: {ctx: {...}}}}
-        for fls_id, item in human_review.get("fls_removals", {}).items():
-            decisions = item.get("decisions", {})
-            contexts = item.get("contexts", [])
-            for ctx in contexts:
-                ctx_dec = decisions.get(ctx, {})
-                if isinstance(ctx_dec, dict):
-                    dec = ctx_dec.get("decision")
-                else:
-                    dec = None
-                if dec == "accept":
-                    summary["by_aspect"]["fls_removals"][ctx]["accepted"] += 1
-                elif dec == "reject":
-                    summary["by_aspect"]["fls_removals"][ctx]["rejected"] += 1
-                else:
-                    summary["by_aspect"]["fls_removals"][ctx]["pending"] += 1
+            categorization_counts[_DECISION_COUNT_KEYS.get(cat.get("decision"), "pending")] += 1
         
-        # FLS additions - per-context structure
-        for fls_id, item in human_review.get("fls_additions", {}).items():
-            decisions = item.get("decisions", {})
-            contexts = item.get("contexts", [])
-            for ctx in contexts:
-                ctx_dec = decisions.get(ctx, {})
-                if isinstance(ctx_dec, dict):
-                    dec = ctx_dec.get("decision")
-                else:
-                    dec = None
-                if dec == "accept":
-                    summary["by_aspect"]["fls_additions"][ctx]["accepted"] += 1
-                elif dec == "reject":
-                    summary["by_aspect"]["fls_additions"][ctx]["rejected"] += 1
-                else:
-                    summary["by_aspect"]["fls_additions"][ctx]["pending"] += 1
+        # FLS removals/additions - per-context structure:
+        # {fls_id: {contexts: [...], decisions: {ctx: {...}}}}
+        for aspect, ctx_counts in fls_counts.items():
+            for item in human_review.get(aspect, {}).values():
+                decisions = item.get("decisions", {})
+                for ctx in item.get("contexts", []):
+                    ctx_dec = decisions.get(ctx, {})
+                    dec = ctx_dec.get("decision") if isinstance(ctx_dec, dict) else None
+                    ctx_counts[ctx][_DECISION_COUNT_KEYS.get(dec, "pending")] += 1
         
         # Specificity
         spec = human_review.get("specificity", {})
         if spec:
-            dec = spec.get("decision")
-            if dec == "accept":
-                summary["by_aspect"]["specificity"]["accepted"] += 1
-            elif dec == "reject":
-                summary["by_aspect"]["specificity"]["rejected"] += 1
-            else:
-                summary["by_aspect"]["specificity"]["pending"] += 1
+            specificity_counts[_DECISION_COUNT_KEYS.get(spec.get("decision"), "pending")] += 1
         
         # ADD-6 divergence
         add6 = human_review.get("add6_divergence", {})
         if add6:
-            dec = add6.get("decision")
-            if dec == "accept":
-                summary["by_aspect"]["add6_divergence"]["accepted"] += 1
-            elif dec == "reject":
-                summary["by_aspect"]["add6_divergence"]["rejected"] += 1
-            else:
-                summary["by_aspect"]["add6_divergence"]["pending"] += 1
+            add6_counts[_DECISION_COUNT_KEYS.get(add6.get("decision"), "pending")] += 1
     
     return summary
@@ -55,6 +55,11 @@ CATEGORY_CODES = {
 # Reverse mapping for JSON output
 CATEGORY_NAMES = {v: k for k, v in CATEGORY_CODES.items()}
 
+# Category codes pre-rendered as JSON object keys, and key -> name for reporting
+_CAT_KEY_STR = {v: str(v) for v in CATEGORY_CODES.values()}
+_CAT_NAME_BY_KEY = {str(v): k for k, v in CATEGORY_CODES.items()}
+_SYNTAX_CAT_KEY = _CAT_KEY_STR[CATEGORY_CODES["syntax"]]
+
 # RST rubric text to category code mapping
 RUBRIC_TO_CATEGORY = {
     "Legality Rules": -2,
@@ -130,6 +135,20 @@ from fls_tools.shared import (
 
 # get_project_root is imported from fls_tools.shared
 
+# Section anchors (.. _fls_xxx:) and paragraph IDs (:dp:`fls_xxx`)
+_ANCHOR_PATTERN = r'\.\.\s+_(fls_[a-zA-Z0-9]+):'
+_PARAGRAPH_ID_PATTERN = r':dp:`(fls_[a-zA-Z0-9]+)`'
+_ANCHOR_RE = re.compile(_ANCHOR_PATTERN)
+_PARAGRAPH_ID_RE = re.compile(_PARAGRAPH_ID_PATTERN)
+_FLS_ID_RE = re.compile(f'{_ANCHOR_PATTERN}|{_PARAGRAPH_ID_PATTERN}')
+
+# A non-blank line followed by an RST underline (one repeated character).
+# The underline is matched in a lookahead so it can also start the next match.
+_TITLE_RE = re.compile(
+    r'^([^\n]*\S[^\n]*)\n(?=(([=\-~^"])\3*[^\S\n]*)$)',
+    re.MULTILINE,
+)
+
 
 def get_section_level(underline: str) -> int:
     """
@@ -150,12 +169,7 @@ def extract_fls_anchors(content: str) -> list[tuple[int, str]]:
     Extract all FLS section anchors (.. _fls_xxx:) with their positions.
     Returns list of (position, fls_id).
     """
-    pattern = r'\.\.\s+_fls_([a-zA-Z0-9]+):'
-    anchors = []
-    for match in re.finditer(pattern, content):
-        fls_id = f"fls_{match.group(1)}"
-        anchors.append((match.start(), fls_id))
-    return anchors
+    return [(m.start(), m.group(1)) for m in _ANCHOR_RE.finditer(content)]
 
 
 def extract_paragraph_ids(content: str) -> list[tuple[int, str]]:
@@ -163,11 +177,23 @@ def extract_paragraph_ids(content: str) -> list[tuple[int, str]]:
     Extract all paragraph-level FLS IDs (:dp:`fls_xxx`) with positions.
     Returns list of (position, fls_id).
     """
-    pattern = r':dp:`(fls_[a-zA-Z0-9]+)`'
+    return [(m.start(), m.group(1)) for m in _PARAGRAPH_ID_RE.finditer(content)]
+
+
+def extract_fls_ids(content: str) -> tuple[list[tuple[int, str]], list[tuple[int, str]]]:
+    """
+    Extract section anchors and paragraph IDs in a single scan of the content.
+    Returns (anchors, paragraphs) as from extract_fls_anchors/extract_paragraph_ids.
+    """
+    anchors = []
     paragraphs = []
-    for match in re.finditer(pattern, content):
-        paragraphs.append((match.start(), match.group(1)))
-    return paragraphs
+    for match in _FLS_ID_RE.finditer(content):
+        anchor_id = match.group(1)
+        if anchor_id is not None:
+            anchors.append((match.start(), anchor_id))
+        else:
+            paragraphs.append((match.start(), match.group(2)))
+    return anchors, paragraphs
 
 
 def extract_section_titles(content: str) -> list[tuple[int, str, int]]:
@@ -175,24 +201,14 @@ def extract_section_titles(content: str) -> list[tuple[int, str, int]]:
     Extract section titles with their positions and levels.
     Returns list of (position, title, level).
     """
-    lines = content.split('\n')
     sections = []
     
-    i = 0
-    while i < len(lines) - 1:
-        line = lines[i].strip()
-        next_line = lines[i + 1] if i + 1 < len(lines) else ""
-        
-        # Check if next line is an underline (all same character, length >= title)
-        if line and next_line and len(next_line) >= len(line):
-            underline_char = next_line[0]
-            if underline_char in '=-~^"' and all(c == underline_char for c in next_line.strip()):
-                # Find position in original content
-                pos = content.find(line + '\n' + next_line)
-                if pos >= 0:
-                    level = get_section_level(underline_char)
-                    sections.append((pos, line, level))
-        i += 1
+    for match in _TITLE_RE.finditer(content):
+        line = match.group(1).strip()
+        # Underline must be at least as long as the title
+        if len(match.group(2)) >= len(line):
+            level = get_section_level(match.group(3))
+            sections.append((match.start(1), line, level))
     
     return sections
 
@@ -230,9 +246,20 @@ def extract_syntax_blocks(content: str, start: int, end: int) -> list[tuple[str,
         # Clean up indentation
         lines = syntax_text.split('\n')
         # Remove common leading whitespace
-        if lines:
-            min_indent = min(len(line) - len(line.lstrip()) for line in lines if line.strip())
-            syntax_text = '\n'.join(line[min_indent:] if len(line) > min_indent else line for line in lines)
+        min_indent = min(
+            (len(line) - len(line.lstrip(' \t')) for line in lines if line.strip()),
+            default=0,
+        )
+        # Dedent only as many lines as survive truncation below
+        dedented = []
+        length = -1  # no newline before the first line
+        for line in lines:
+            line = line[min_indent:] if len(line) > min_indent else line
+            dedented.append(line)
+            length += len(line) + 1
+            if length > 500:
+                break
+        syntax_text = '\n'.join(dedented)
         
         # Truncate if too long
         if len(syntax_text) > 500:
@@ -350,7 +377,7 @@ def extract_paragraphs_by_rubric(
         para_text = extract_paragraph_text(content, para_start, para_end)
         
         if para_text and len(para_text) > 5:  # Skip very short/empty paragraphs
-            cat_key = str(current_category)
+            cat_key = _CAT_KEY_STR[current_category]
             if cat_key not in result:
                 result[cat_key] = {"paragraphs": {}}
             result[cat_key]["paragraphs"][pid] = para_text
@@ -358,7 +385,7 @@ def extract_paragraphs_by_rubric(
     # Extract syntax blocks
     syntax_blocks = extract_syntax_blocks(content, start, end)
     if syntax_blocks:
-        cat_key = str(CATEGORY_CODES["syntax"])
+        cat_key = _SYNTAX_CAT_KEY
         if cat_key not in result:
             result[cat_key] = {"paragraphs": {}}
         for i, syntax_text in enumerate(syntax_blocks):
@@ -369,38 +396,48 @@ def extract_paragraphs_by_rubric(
     return result
 
 
+# Constructs dropped from section content. Table and code-block bodies end at
+# the next unindented paragraph, which must be looked for only after rubric and
+# syntax directives are gone, so the removals run as two passes.
+_DIRECTIVE_RE = re.compile(
+    r'\.\.\s+rubric::[^\n]+\n'
+    r'|\.\.\s+syntax::\n[\s\S]*?(?=\n\n|\Z)'
+    r'|\.\.\s+informational-section::\n'
+)
+_BLOCK_RE = re.compile(
+    r'\.\.\s+list-table::\n[\s\S]*?(?=\n\n[^\s]|\Z)'
+    r'|\.\.\s+code-block::[^\n]*\n[\s\S]*?(?=\n\n[^\s]|\Z)'
+    r'|\.\.\s+_fls_[a-zA-Z0-9]+:\n*'
+    r'|:dp:`fls_[a-zA-Z0-9]+`\s*'
+)
+# Inline roles and literals replaced by their text
+_ROLE_RE = re.compile(r':(?:t|c|std|dt|p|s):`([^`]+)`|``([^`]+)``')
+_UNDERLINE_RE = re.compile(r'\n[=\-~^"]{3,}\n')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+_SPACES_RE = re.compile(r' +')
+
+
+def _role_text(match: re.Match) -> str:
+    return match.group(1) or match.group(2)
+
+
 def extract_section_content(content: str, start: int, end: int) -> str:
     """Extract and clean section content between positions for embeddings."""
     section_text = content[start:end]
     
-    # Remove RST directives we don't need for embeddings
-    section_text = re.sub(r'\.\.\s+rubric::[^\n]+\n', '', section_text)
-    section_text = re.sub(r'\.\.\s+syntax::\n[\s\S]*?(?=\n\n|\Z)', '', section_text)
-    section_text = re.sub(r'\.\.\s+informational-section::\n', '', section_text)
-    section_text = re.sub(r'\.\.\s+list-table::\n[\s\S]*?(?=\n\n[^\s]|\Z)', '', section_text)
-    section_text = re.sub(r'\.\.\s+code-block::[^\n]*\n[\s\S]*?(?=\n\n[^\s]|\Z)', '', section_text)
-    
-    # Remove anchor definitions
-    section_text = re.sub(r'\.\.\s+_fls_[a-zA-Z0-9]+:\n*', '', section_text)
+    # Remove RST directives, anchor definitions and paragraph ID markers
+    section_text = _DIRECTIVE_RE.sub('', section_text)
+    section_text = _BLOCK_RE.sub('', section_text)
     
-    # Clean up paragraph ID markers but keep the text
-    section_text = re.sub(r':dp:`fls_[a-zA-Z0-9]+`\s*', '', section_text)
-    
-    # Remove RST formatting markers
-    section_text = re.sub(r':t:`([^`]+)`', r'\1', section_text)
-    section_text = re.sub(r':c:`([^`]+)`', r'\1', section_text)
-    section_text = re.sub(r':std:`([^`]+)`', r'\1', section_text)
-    section_text = re.sub(r':dt:`([^`]+)`', r'\1', section_text)
-    section_text = re.sub(r':p:`([^`]+)`', r'\1', section_text)
-    section_text = re.sub(r':s:`([^`]+)`', r'\1', section_text)
-    section_text = re.sub(r'``([^`]+)``', r'\1', section_text)
+    # Remove RST formatting markers, keeping the text
+    section_text = _ROLE_RE.sub(_role_text, section_text)
     
     # Remove underlines
-    section_text = re.sub(r'\n[=\-~^"]{3,}\n', '\n', section_text)
+    section_text = _UNDERLINE_RE.sub('\n', section_text)
     
     # Clean up excessive whitespace
-    section_text = re.sub(r'\n{3,}', '\n\n', section_text)
-    section_text = re.sub(r' +', ' ', section_text)
+    section_text = _MULTI_NEWLINE_RE.sub('\n\n', section_text)
+    section_text = _SPACES_RE.sub(' ', section_text)
     
     return section_text.strip()
 
@@ -413,8 +450,7 @@ def parse_rst_file(file_path: Path) -> list[dict]:
     content = file_path.read_text(encoding='utf-8')
     
     # Extract all anchors, paragraphs, titles, and rubrics
-    anchors = extract_fls_anchors(content)
-    paragraphs = extract_paragraph_ids(content)
+    anchors, paragraphs = extract_fls_ids(content)
     titles = extract_section_titles(content)
     rubrics = extract_rubrics(content)
     
@@ -465,31 +501,28 @@ def parse_rst_file(file_path: Path) -> list[dict]:
 def build_hierarchy(sections: list[dict]) -> list[dict]:
     """
     Build parent-child relationships between sections based on level and position.
-    """
-    # Sort by file and position
-    sections_sorted = sorted(sections, key=lambda s: (s['file'], s['position']))
     
-    # Track section stack for hierarchy
-    stack = []  # Stack of (level, fls_id)
+    Sections must belong to a single file and be in position order, as
+    returned by parse_rst_file().
+    """
+    # Most recent section seen at each level (levels are 1-5, see get_section_level)
+    parents = [None] * 6
     
-    for section in sections_sorted:
+    for section in sections:
         level = section['level']
-        fls_id = section['fls_id']
-        
-        # Pop stack until we find a parent (lower level)
-        while stack and stack[-1][0] >= level:
-            stack.pop()
         
-        # Set parent if stack is not empty
-        if stack:
-            section['parent_fls_id'] = stack[-1][1]
-        else:
-            section['parent_fls_id'] = None
+        # Parent is the nearest open section at a shallower level
+        section['parent_fls_id'] = next(
+            (parents[lvl] for lvl in range(level - 1, 0, -1) if parents[lvl] is not None),
+            None,
+        )
         
-        # Push current section onto stack
-        stack.append((level, fls_id))
+        # Open this section and close any deeper ones
+        parents[level] = section['fls_id']
+        for lvl in range(level + 1, len(parents)):
+            parents[lvl] = None
     
-    return sections_sorted
+    return sections
 
 
 def add_sibling_info(sections: list[dict]) -> list[dict]:
@@ -502,13 +535,13 @@ def add_sibling_info(sections: list[dict]) -> list[dict]:
         parent = s.get('parent_fls_id')
         if parent not in by_parent:
             by_parent[parent] = []
-        by_parent[parent].append(s['fls_id'])
+        by_parent[parent].append(s)
     
-    # Add siblings to each section
-    for s in sections:
-        parent = s.get('parent_fls_id')
-        siblings = by_parent.get(parent, [])
-        s['sibling_fls_ids'] = [sib for sib in siblings if sib != s['fls_id']]
+    # Add siblings to each section: the group's IDs minus its own slot
+    for group in by_parent.values():
+        sibling_ids = [s['fls_id'] for s in group]
+        for i, s in enumerate(group):
+            s['sibling_fls_ids'] = sibling_ids[:i] + sibling_ids[i + 1:]
     
     return sections
 
@@ -528,7 +561,7 @@ def compute_statistics(sections: list[dict]) -> dict:
             by_category[cat_int] = by_category.get(cat_int, 0) + para_count
     
     # Convert keys to strings for JSON
-    by_category_str = {str(k): v for k, v in sorted(by_category.items())}
+    by_category_str = {_CAT_KEY_STR[k]: v for k, v in sorted(by_category.items())}
     
     return {
         "total_sections": len(sections),
@@ -537,6 +570,29 @@ def compute_statistics(sections: list[dict]) -> dict:
     }
 
 
+def write_chapter_json(path: Path, chapter_meta: dict, sections: list[dict]) -> None:
+    """
+    Write a chapter file as {**chapter_meta, "sections": sections}.
+    
+    Sections are encoded and written one at a time, so the whole document is
+    never held as a single string. Output matches json.dump(indent=2).
+    """
+    head = json.dumps(chapter_meta, indent=2, ensure_ascii=False)
+    with open(path, 'wb') as f:
+        # Reopen the envelope object to append the "sections" key
+        f.write(head[:-2].encode())
+        f.write(b',\n  "sections": [')
+        if not sections:
+            f.write(b']\n}')
+            return
+        for i, section in enumerate(sections):
+            # Encoded JSON never contains raw newlines inside strings
+            text = json.dumps(section, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+            f.write(('\n    ' if i == 0 else ',\n    ').encode())
+            f.write(text.encode())
+        f.write(b'\n  ]\n}')
+
+
 def main():
     """Main extraction function."""
     project_root = get_project_root()
@@ -552,7 +608,9 @@ def main():
     
     # Process each chapter
     chapters_data = []
-    all_sections = []
+    # Only one section is kept for the summary: the 11th overall, else the first
+    sample = None
+    sections_seen = 0
     aggregate_stats = {
         "total_sections": 0,
         "total_paragraphs": 0,
@@ -598,22 +656,20 @@ def main():
             aggregate_stats["paragraphs_by_category"][cat] = \
                 aggregate_stats["paragraphs_by_category"].get(cat, 0) + count
         
-        # Create chapter output
-        chapter_output = {
+        # Create chapter output (sections are streamed after these fields)
+        chapter_meta = {
             "chapter": chapter_num,
             "title": CHAPTER_TITLES.get(file_stem, file_stem),
             "fls_id": chapter_fls_id,
             "file": file_stem,
             "extraction_date": str(date.today()),
-            "category_codes": {str(v): k for k, v in CATEGORY_CODES.items()},
+            "category_codes": _CAT_NAME_BY_KEY,
             "statistics": stats,
-            "sections": sections
         }
         
         # Save chapter file
         chapter_file = output_dir / f"chapter_{chapter_num:02d}.json"
-        with open(chapter_file, 'w', encoding='utf-8') as f:
-            json.dump(chapter_output, f, indent=2, ensure_ascii=False)
+        write_chapter_json(chapter_file, chapter_meta, sections)
         
         print(f"    Sections: {stats['total_sections']}, Paragraphs: {stats['total_paragraphs']}")
         
@@ -627,7 +683,11 @@ def main():
             "paragraphs": stats["total_paragraphs"]
         })
         
-        all_sections.extend(sections)
+        if sections_seen <= 10 < sections_seen + len(sections):
+            sample = sections[10 - sections_seen]
+        elif sample is None and sections:
+            sample = sections[0]
+        sections_seen += len(sections)
     
     # Sort aggregate stats by category
     aggregate_stats["paragraphs_by_category"] = dict(
@@ -638,14 +698,15 @@ def main():
     index_output = {
         "source": "FLS RST files",
         "extraction_date": str(date.today()),
-        "category_codes": {str(v): k for k, v in CATEGORY_CODES.items()},
+        "category_codes": _CAT_NAME_BY_KEY,
         "chapters": chapters_data,
         "aggregate_statistics": aggregate_stats
     }
     
     index_file = output_dir / "index.json"
-    with open(index_file, 'w', encoding='utf-8') as f:
-        json.dump(index_output, f, indent=2, ensure_ascii=False)
+    index_file.write_bytes(
+        json.dumps(index_output, indent=2, ensure_ascii=False).encode()
+    )
     
     print(f"\nSaved index to: {index_file}")
     
@@ -658,12 +719,11 @@ def main():
     print(f"  Total paragraphs: {aggregate_stats['total_paragraphs']}")
     print(f"\n  Paragraphs by category:")
     for cat, count in aggregate_stats["paragraphs_by_category"].items():
-        cat_name = CATEGORY_NAMES.get(int(cat), "unknown")
+        cat_name = _CAT_NAME_BY_KEY.get(cat, "unknown")
         print(f"    {cat:>3} ({cat_name:25}): {count:5}")
     
     # Show sample section
-    if all_sections:
-        sample = all_sections[10] if len(all_sections) > 10 else all_sections[0]
+    if sample is not None:
         print(f"\nSample section:")
         print(f"  FLS ID: {sample['fls_id']}")
         print(f"  Title: {sample['title']}")
@@ -673,7 +733,7 @@ def main():
         print(f"  Rubrics: {list(sample['rubrics'].keys())}")
         for cat_key, rubric_data in sample['rubrics'].items():
             para_count = len(rubric_data.get('paragraphs', {}))
-            cat_name = CATEGORY_NAMES.get(int(cat_key), "unknown")
+            cat_name = _CAT_NAME_BY_KEY.get(cat_key, "unknown")
             print(f"    {cat_key} ({cat_name}): {para_count} paragraphs")
     
     # Generate valid FLS IDs file for downstream validation
@@ -26,6 +26,15 @@ Options:
     --skip-queries             Skip MISRA query embedding generation
     --skip-rationale           Skip MISRA rationale embedding generation
     --skip-amplification       Skip MISRA amplification embedding generation
+    --no-cache                 Re-encode all texts, ignoring cache/encode_cache/
+    --fuzzy-cache              Reuse cached embeddings across whitespace/punctuation/case edits
+    --device DEVICE            Torch device (default: cuda if available, else cpu)
+    --batch-size N             Encode batch size (default: 128 on GPU, 32 on CPU)
+    --backend BACKEND          torch (default), onnx or openvino
+    --model-file FILE          Backend model file, e.g. onnx/model_qint8_avx512_vnni.onnx
+    --multi-process            Shard encoding across all GPUs (or several CPU workers)
+    --embedding-dtype DTYPE    Storage dtype: float32 (default), float16 or int8
+    --format FORMAT            pickle (default) or npy (.npy array + .meta.json, mmap-able)
 
 Input:
     cache/misra_c_extracted_text.json
@@ -41,8 +50,11 @@ Output:
 """
 
 import argparse
+import hashlib
 import json
 import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
@@ -61,10 +73,36 @@ from fls_tools.shared import (
     get_standard_query_embeddings_path,
     get_standard_rationale_embeddings_path,
     get_standard_amplification_embeddings_path,
+    get_encode_cache_path,
     CATEGORY_NAMES,
+    EMBEDDING_DTYPES,
+    quantize_embeddings,
+    EMBEDDING_FORMATS,
+    write_embeddings_file,
 )
 
 
+# Default encode batch sizes; GPUs have the memory to fill larger batches
+GPU_BATCH_SIZE = 128
+CPU_BATCH_SIZE = 32
+
+# Threads used to read FLS chapter files
+CHAPTER_LOAD_WORKERS = 8
+
+# Mixed into encode cache keys; change it whenever cached vectors change
+# meaning (they are L2-normalised since the "norm" tag)
+CACHE_KEY_TAG = "norm"
+
+# Words compared by the --fuzzy-cache lookup
+_WORD_RE = re.compile(r"\w+")
+
+# Characters of paragraph text kept in the paragraph metadata
+PARAGRAPH_PREVIEW_CHARS = 200
+
+# Texts per work item sent to each --multi-process worker
+MULTI_PROCESS_CHUNK_SIZE = 2000
+
+
 def load_misra_text(project_root: Path, standard: str = "misra-c") -> list[dict]:
     """Load MISRA extracted text from cache."""
     cache_path = get_standard_extracted_text_path(project_root, standard)
@@ -73,9 +111,15 @@ def load_misra_text(project_root: Path, standard: str = "misra-c") -> list[dict]
             f"MISRA text not found at {cache_path}. "
             "Run extract_misra_text.py first."
         )
-    with open(cache_path, encoding='utf-8') as f:
-        data = json.load(f)
-    return data['guidelines']
+    return json.loads(cache_path.read_bytes())['guidelines']
+
+
+def _load_chapter_sections(chapter_file: Path) -> list[dict] | None:
+    """Load the sections of one FLS chapter file, or None if it is missing."""
+    try:
+        return json.loads(chapter_file.read_bytes())['sections']
+    except FileNotFoundError:
+        return None
 
 
 def load_fls_sections(project_root: Path) -> list[dict]:
@@ -83,7 +127,8 @@ def load_fls_sections(project_root: Path) -> list[dict]:
     Load FLS sections from chapter files via index.json.
     
     The FLS content is split into per-chapter JSON files for easier
-    management. This function loads all chapters and concatenates sections.
+    management. This function loads all chapters (in parallel threads) and
+    concatenates sections in index order.
     """
     fls_dir = get_fls_dir(project_root)
     index_path = get_fls_index_path(project_root)
@@ -97,24 +142,53 @@ def load_fls_sections(project_root: Path) -> list[dict]:
     with open(index_path, encoding='utf-8') as f:
         index = json.load(f)
     
+    chapter_files = [fls_dir / chapter_info['file'] for chapter_info in index['chapters']]
+    
+    # Chapters are independent, so read and parse them concurrently
+    with ThreadPoolExecutor(max_workers=CHAPTER_LOAD_WORKERS) as executor:
+        chapters = list(executor.map(_load_chapter_sections, chapter_files))
+    
     all_sections = []
-    for chapter_info in index['chapters']:
-        chapter_file = fls_dir / chapter_info['file']
-        if not chapter_file.exists():
+    for chapter_file, sections in zip(chapter_files, chapters, strict=True):
+        if sections is None:
             print(f"  Warning: Chapter file not found: {chapter_file}")
             continue
-        
-        with open(chapter_file, encoding='utf-8') as f:
-            chapter_data = json.load(f)
-        
-        all_sections.extend(chapter_data['sections'])
+        all_sections.extend(sections)
     
     return all_sections
 
 
-def prepare_misra_texts(guidelines: list[dict]) -> list[tuple[str, str]]:
+def truncate_to_tokens(text: str, tokenizer=None, max_tokens: int | None = None) -> str:
+    """
+    Cut text just after its first max_tokens tokens.
+    
+    The encoder never looks past max_seq_length tokens, so the dropped tail
+    does not affect the embedding; it only costs hashing, caching and a
+    second tokenization inside encode(). Needs a fast (Rust) tokenizer for
+    character offsets; otherwise the text is returned unchanged.
+    """
+    # Every token covers at least one character
+    if tokenizer is None or not max_tokens or len(text) <= max_tokens:
+        return text
+    if not getattr(tokenizer, 'is_fast', False):
+        return text
+    offsets = tokenizer(
+        text, add_special_tokens=False, truncation=True, max_length=max_tokens,
+        return_offsets_mapping=True,
+    )['offset_mapping']
+    if len(offsets) < max_tokens:
+        return text
+    return text[:offsets[-1][1]]
+
+
+def prepare_misra_texts(
+    guidelines: list[dict],
+    tokenizer=None,
+    max_tokens: int | None = None,
+) -> list[tuple[str, str]]:
     """
     Prepare MISRA guidelines for embedding.
+    If a tokenizer is given, texts are cut after max_tokens tokens.
     Returns list of (guideline_id, text_to_embed).
     """
     texts = []
@@ -150,7 +224,7 @@ def prepare_misra_texts(guidelines: list[dict]) -> list[tuple[str, str]]:
         if len(text.strip()) < 20:
             text = g.get('title', gid)  # Fallback to title or ID
         
-        texts.append((gid, text))
+        texts.append((gid, truncate_to_tokens(text, tokenizer, max_tokens)))
     
     return texts
 
@@ -185,6 +259,11 @@ def prepare_misra_query_texts(guidelines: list[dict]) -> tuple[list[tuple[str, s
     return texts, metadata
 
 
+def _title_line(guideline: dict) -> str:
+    """First line of a guideline title, capped at 100 characters."""
+    return guideline.get('title', '').split('\n', 1)[0][:100]
+
+
 def prepare_misra_rationale_texts(guidelines: list[dict]) -> list[tuple[str, str]]:
     """
     Prepare MISRA rationale texts for embedding.
@@ -200,12 +279,7 @@ def prepare_misra_rationale_texts(guidelines: list[dict]) -> list[tuple[str, str
         
         if rationale and len(rationale.strip()) >= 20:
             # Add title context for better matching
-            title = g.get('title', '').split('\n')[0]
-            if len(title) > 100:
-                title = title[:100]
-            
-            text = f"{title}\n\nRationale: {rationale}"
-            texts.append((f"{gid}.rationale", text))
+            texts.append((f"{gid}.rationale", _title_line(g) + "\n\nRationale: " + rationale))
     
     return texts
 
@@ -226,19 +300,19 @@ def prepare_misra_amplification_texts(guidelines: list[dict]) -> list[tuple[str,
         
         if amplification and len(amplification.strip()) >= 20:
             # Add title context for better matching
-            title = g.get('title', '').split('\n')[0]
-            if len(title) > 100:
-                title = title[:100]
-            
-            text = f"{title}\n\nAmplification: {amplification}"
-            texts.append((f"{gid}.amplification", text))
+            texts.append((f"{gid}.amplification", _title_line(g) + "\n\nAmplification: " + amplification))
     
     return texts
 
 
-def prepare_fls_section_texts(sections: list[dict]) -> list[tuple[str, str]]:
+def prepare_fls_section_texts(
+    sections: list[dict],
+    tokenizer=None,
+    max_tokens: int | None = None,
+) -> list[tuple[str, str]]:
     """
     Prepare FLS sections for embedding (coarse-grained).
+    If a tokenizer is given, content is also cut after max_tokens tokens.
     Returns list of (fls_id, text_to_embed).
     """
     texts = []
@@ -258,7 +332,7 @@ def prepare_fls_section_texts(sections: list[dict]) -> list[tuple[str, str]]:
             content = s['content']
             if len(content) > 8000:
                 content = content[:8000] + "..."
-            parts.append(content)
+            parts.append(truncate_to_tokens(content, tokenizer, max_tokens))
         
         text = '\n'.join(parts)
         
@@ -285,11 +359,21 @@ def prepare_fls_paragraph_texts(
     Returns:
         Tuple of:
         - List of (paragraph_fls_id, text_to_embed) tuples
-        - Dict of metadata: paragraph_fls_id -> {section_fls_id, section_title, category, category_name}
+        - Dict of metadata: paragraph_fls_id -> {section_fls_id, section_title, category, category_name, text}
+          (text is a preview of the first PARAGRAPH_PREVIEW_CHARS characters)
     """
     texts = []
     metadata = {}
     
+    # Rubric keys are the string form of the category code; resolve each
+    # included category once so excluded rubrics are skipped without int()
+    included = {}
+    for cat_code in include_categories:
+        cat_name = CATEGORY_NAMES.get(cat_code, f"unknown_{cat_code}")
+        # Convert to human-readable format for embedding
+        cat_display = cat_name.replace('_', ' ').title()
+        included[str(cat_code)] = (cat_code, cat_name, cat_display)
+    
     for section in sections:
         section_fls_id = section['fls_id']
         section_title = section.get('title', '')
@@ -297,54 +381,199 @@ def prepare_fls_paragraph_texts(
         rubrics = section.get('rubrics', {})
         
         for cat_code_str, rubric_data in rubrics.items():
-            cat_code = int(cat_code_str)
-            
             # Skip categories not in our include set
-            if cat_code not in include_categories:
+            if cat_code_str not in included:
                 continue
-            
-            cat_name = CATEGORY_NAMES.get(cat_code, f"unknown_{cat_code}")
-            # Convert to human-readable format for embedding
-            cat_display = cat_name.replace('_', ' ').title()
+            cat_code, cat_name, cat_display = included[cat_code_str]
             
             paragraphs = rubric_data.get('paragraphs', {})
             
+            # Build text with context for better semantic matching
+            # Format: "Section: {title}\nCategory: {category}\n{paragraph_text}"
+            prefix = f"Section: {section_title}\nCategory: {cat_display}\n"
+            
             for para_fls_id, para_text in paragraphs.items():
-                # Build text with context for better semantic matching
-                # Format: "Section: {title}\nCategory: {category}\n{paragraph_text}"
-                text = f"Section: {section_title}\nCategory: {cat_display}\n{para_text}"
-                
-                texts.append((para_fls_id, text))
+                texts.append((para_fls_id, prefix + para_text))
                 
                 metadata[para_fls_id] = {
                     'section_fls_id': section_fls_id,
                     'section_title': section_title,
                     'category': cat_code,
                     'category_name': cat_name,
-                    'text': para_text,  # Store original text for preview
+                    'text': para_text[:PARAGRAPH_PREVIEW_CHARS],  # Preview only; full text is in the chapter files
                 }
     
     return texts, metadata
 
 
-def generate_embeddings(texts: list[tuple[str, str]], model) -> dict:
-    """
-    Generate embeddings for a list of (id, text) pairs.
-    Returns dict with ids, embeddings array, and id_to_index lookup.
+def text_cache_key(model_name: str, text: str) -> str:
+    """Content hash identifying a text's (normalised) embedding under a given model."""
+    return hashlib.sha256(f"{model_name}\x00{CACHE_KEY_TAG}\x00{text}".encode()).hexdigest()
+
+
+def fuzzy_cache_key(model_name: str, text: str) -> str:
     """
-    ids = [t[0] for t in texts]
-    text_content = [t[1] for t in texts]
+    Hash of a text's lowercased word sequence under a given model.
     
-    print(f"  Generating embeddings for {len(texts)} items...")
-    embeddings = model.encode(text_content, show_progress_bar=True)
+    Texts that differ only in whitespace, punctuation or case share a key,
+    so small editorial fixes in the sources can reuse an earlier embedding.
+    """
+    words = ' '.join(_WORD_RE.findall(text.lower()))
+    return hashlib.sha256(f"{model_name}\x00{CACHE_KEY_TAG}~\x00{words}".encode()).hexdigest()
+
+
+def load_encode_cache(path: Path) -> dict[str, np.ndarray]:
+    """Load the text -> embedding cache, or start empty if missing or unreadable."""
+    if not path.exists():
+        return {}
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        print(f"  Warning: Ignoring unreadable encode cache: {path}")
+        return {}
+
+
+def save_encode_cache(path: Path, cache: dict[str, np.ndarray]) -> None:
+    """Save the text -> embedding cache."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _run_encode(model, texts: list[str], batch_size: int, pool=None) -> np.ndarray:
+    """
+    Encode texts in this process, or shard them across a multi-process pool.
     
-    result = {
-        'ids': ids,
-        'embeddings': embeddings,
-        'id_to_index': {id_: i for i, id_ in enumerate(ids)}
-    }
+    Embeddings are L2-normalised by the model, so cosine similarity on them
+    is a plain dot product.
+    """
+    if pool is not None and texts:
+        return model.encode_multi_process(
+            texts, pool, batch_size=batch_size, chunk_size=MULTI_PROCESS_CHUNK_SIZE,
+            normalize_embeddings=True,
+        )
+    return model.encode(
+        texts, batch_size=batch_size, show_progress_bar=True, normalize_embeddings=True
+    )
+
+
+def encode_texts(
+    text_content: list[str],
+    model,
+    cache: dict[str, np.ndarray] | None = None,
+    model_name: str = "",
+    batch_size: int = 32,
+    pool=None,
+    fuzzy: bool = False,
+) -> np.ndarray:
+    """
+    Encode texts into an (N x D) embeddings array, in input order.
+    
+    Texts are passed in source order: SentenceTransformer.encode() already
+    sorts its input by length before batching (to minimise padding) and
+    returns embeddings in input order, so no pre-sorting is needed here.
+    
+    Identical texts are encoded (and so tokenized) once and the result is
+    shared; encode() tokenizes each batch with the model's fast tokenizer,
+    so there is no separate tokenization pass to reuse. If a pool
+    from model.start_multi_process_pool() is given, encoding is sharded
+    across its worker processes.
+    
+    If a cache dict is given (see text_cache_key), texts already in it are
+    not re-encoded, and newly encoded texts are added to it. With fuzzy=True
+    a text that misses the exact key may also reuse the embedding stored
+    under its fuzzy_cache_key.
+    """
+    index_of: dict[str, int] = {}
+    inverse = [index_of.setdefault(text, len(index_of)) for text in text_content]
+    unique = list(index_of)
+    
+    if cache is None:
+        print(f"  Generating embeddings for {len(text_content)} items "
+              f"({len(unique)} unique)...")
+        encoded = _run_encode(model, unique, batch_size, pool)
+        return encoded if len(unique) == len(text_content) else encoded[inverse]
+    
+    keys = [text_cache_key(model_name, text) for text in unique]
+    miss = [i for i, key in enumerate(keys) if key not in cache]
+    fuzzy_keys = {}
+    if fuzzy:
+        fuzzy_keys = {i: fuzzy_cache_key(model_name, unique[i]) for i in miss}
+        for i, fuzzy_key in fuzzy_keys.items():
+            if fuzzy_key in cache:
+                cache[keys[i]] = cache[fuzzy_key]
+        miss = [i for i in miss if keys[i] not in cache]
+    print(f"  Generating embeddings for {len(text_content)} items "
+          f"({len(unique)} unique, {len(unique) - len(miss)} cached)...")
+    if miss:
+        encoded = _run_encode(model, [unique[i] for i in miss], batch_size, pool)
+        for i, embedding in zip(miss, encoded, strict=True):
+            cache[keys[i]] = embedding
+            if fuzzy:
+                cache[fuzzy_keys[i]] = embedding
+    return np.array([cache[keys[i]] for i in inverse]).reshape(
+        len(inverse), model.get_sentence_embedding_dimension()
+    )
+
+
+def generate_embeddings_batch(
+    text_groups: dict[str, list[tuple[str, str]]],
+    model,
+    cache: dict[str, np.ndarray] | None = None,
+    model_name: str = "",
+    batch_size: int = 32,
+    pool=None,
+    fuzzy: bool = False,
+) -> dict[str, dict]:
+    """
+    Generate embeddings for several lists of (id, text) pairs at once.
     
-    return result
+    All texts go through a single encode call, so batching and length
+    sorting span every corpus. Returns one generate_embeddings()-style
+    result per group name.
+    """
+    # Unzip each group once into its ids and the shared text list
+    group_ids = {}
+    text_content = []
+    for name, texts in text_groups.items():
+        ids, group_texts = zip(*texts, strict=True) if texts else ((), ())
+        group_ids[name] = list(ids)
+        text_content.extend(group_texts)
+    
+    embeddings = encode_texts(
+        text_content, model, cache, model_name, batch_size, pool, fuzzy=fuzzy
+    )
+    
+    results = {}
+    offset = 0
+    for name, ids in group_ids.items():
+        results[name] = {
+            'ids': ids,
+            'embeddings': embeddings[offset:offset + len(ids)],
+        }
+        offset += len(ids)
+    
+    return results
+
+
+def generate_embeddings(
+    texts: list[tuple[str, str]],
+    model,
+    cache: dict[str, np.ndarray] | None = None,
+    model_name: str = "",
+    batch_size: int = 32,
+    pool=None,
+    fuzzy: bool = False,
+) -> dict:
+    """
+    Generate embeddings for a list of (id, text) pairs.
+    Returns dict with ids and embeddings array; loaders rebuild the
+    id -> index lookup from ids (see read_embeddings_file).
+    """
+    return generate_embeddings_batch(
+        {'texts': texts}, model, cache, model_name, batch_size, pool, fuzzy=fuzzy
+    )['texts']
 
 
 def main():
@@ -361,6 +590,29 @@ def main():
                        help='Skip MISRA rationale embedding generation')
     parser.add_argument('--skip-amplification', action='store_true',
                        help='Skip MISRA amplification embedding generation')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Re-encode every text instead of reusing cached embeddings')
+    parser.add_argument('--fuzzy-cache', action='store_true',
+                       help='Also reuse cached embeddings of texts that differ only in '
+                            'whitespace, punctuation or case')
+    parser.add_argument('--device', default=None,
+                       help='Torch device for encoding, e.g. cuda or cpu (default: cuda if available)')
+    parser.add_argument('--embedding-dtype', choices=EMBEDDING_DTYPES, default='float32',
+                       help='Storage dtype for saved embeddings (int8 adds a per-row scale)')
+    parser.add_argument('--format', choices=EMBEDDING_FORMATS, default='pickle',
+                       help='On-disk layout: a single pickle, or a memory-mappable .npy '
+                            'array with a .meta.json sidecar')
+    parser.add_argument('--batch-size', type=int, default=None,
+                       help=f'Encode batch size (default: {GPU_BATCH_SIZE} on GPU, '
+                            f'{CPU_BATCH_SIZE} on CPU)')
+    parser.add_argument('--backend', choices=('torch', 'onnx', 'openvino'), default='torch',
+                       help='Inference backend (onnx/openvino need sentence-transformers>=3.2 '
+                            'with the matching extra installed)')
+    parser.add_argument('--model-file', default=None,
+                       help='Backend model file within the model repo, e.g. a pre-quantized '
+                            'onnx/model_qint8_avx512_vnni.onnx')
+    parser.add_argument('--multi-process', action='store_true',
+                       help='Shard encoding across all GPUs (or several CPU workers)')
     args = parser.parse_args()
     
     # Parse category codes
@@ -371,180 +623,101 @@ def main():
     # Load sentence transformer model
     print(f"Loading model: {args.model}")
     from sentence_transformers import SentenceTransformer
-    model = SentenceTransformer(args.model)
+    model_kwargs = {}
+    if args.backend != 'torch':
+        model_kwargs['backend'] = args.backend
+        if args.model_file:
+            model_kwargs['model_kwargs'] = {'file_name': args.model_file}
+    model = SentenceTransformer(args.model, device=args.device, **model_kwargs)
+    batch_size = args.batch_size
+    if batch_size is None:
+        batch_size = GPU_BATCH_SIZE if str(model.device).startswith('cuda') else CPU_BATCH_SIZE
     print(f"  Model loaded. Embedding dimension: {model.get_sentence_embedding_dimension()}")
+    print(f"  Device: {model.device}, batch size: {batch_size}")
+    
+    # Text past the model's input window is dropped before encoding
+    tokenizer = getattr(model, 'tokenizer', None)
+    max_tokens = getattr(model, 'max_seq_length', None)
+    
+    # Embeddings of unchanged texts are reused from earlier runs. Other
+    # backends (and quantized model files) get their own cache.
+    cache_model = args.model
+    if args.backend != 'torch':
+        cache_model = f"{args.model}@{args.backend}"
+        if args.model_file:
+            cache_model += f"-{Path(args.model_file).stem}"
+    cache_path = get_encode_cache_path(project_root, cache_model)
+    if args.no_cache:
+        encode_cache = None
+    else:
+        encode_cache = load_encode_cache(cache_path)
+        print(f"  Encode cache: {len(encode_cache)} entries ({cache_path})")
+    
+    # Texts for every embedding level, encoded together below
+    text_groups = {}
     
     # =========================================================================
-    # MISRA Embeddings
+    # MISRA texts
     # =========================================================================
     print("\n" + "="*60)
-    print("MISRA Embeddings")
+    print("MISRA Texts")
     print("="*60)
     
     print("\nLoading MISRA guidelines...")
     guidelines = load_misra_text(project_root)
     print(f"  Loaded {len(guidelines)} guidelines")
     
-    misra_texts = prepare_misra_texts(guidelines)
-    print(f"  Prepared {len(misra_texts)} texts for embedding")
-    
-    print("\nGenerating MISRA embeddings...")
-    misra_embeddings = generate_embeddings(misra_texts, model)
+    text_groups['guideline'] = prepare_misra_texts(guidelines, tokenizer, max_tokens)
+    print(f"  Prepared {len(text_groups['guideline'])} guideline texts for embedding")
     
-    misra_output = get_standard_embeddings_path(project_root, "misra-c")
-    misra_output.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(misra_output, 'wb') as f:
-        pickle.dump({
-            'model': args.model,
-            'generated_date': str(date.today()),
-            'num_items': len(misra_embeddings['ids']),
-            'embedding_dim': model.get_sentence_embedding_dimension(),
-            'data': misra_embeddings
-        }, f)
-    print(f"  Saved to: {misra_output}")
-    print(f"  File size: {misra_output.stat().st_size / 1024 / 1024:.2f} MB")
-    
-    # =========================================================================
-    # MISRA Query Embeddings (from parsed concerns)
-    # =========================================================================
+    # Query texts (from parsed concerns)
+    query_metadata = {}
     if not args.skip_queries:
-        print("\n" + "="*60)
-        print("MISRA Query Embeddings (from parsed concerns)")
-        print("="*60)
-        
         query_texts, query_metadata = prepare_misra_query_texts(guidelines)
         print(f"  Prepared {len(query_texts)} query texts for embedding")
-        
         if query_texts:
-            print("\nGenerating MISRA query embeddings...")
-            query_embeddings = generate_embeddings(query_texts, model)
-            
-            query_output = get_standard_query_embeddings_path(project_root, "misra-c")
-            
-            with open(query_output, 'wb') as f:
-                pickle.dump({
-                    'model': args.model,
-                    'generated_date': str(date.today()),
-                    'num_items': len(query_embeddings['ids']),
-                    'embedding_dim': model.get_sentence_embedding_dimension(),
-                    'level': 'query',
-                    'data': query_embeddings,
-                    'metadata': query_metadata,
-                }, f)
-            print(f"  Saved to: {query_output}")
-            print(f"  File size: {query_output.stat().st_size / 1024 / 1024:.2f} MB")
+            text_groups['query'] = query_texts
         else:
             print("  No query texts found - skipping")
     else:
         print("\n[Skipping MISRA query embeddings]")
     
-    # =========================================================================
-    # MISRA Rationale Embeddings
-    # =========================================================================
     if not args.skip_rationale:
-        print("\n" + "="*60)
-        print("MISRA Rationale Embeddings")
-        print("="*60)
-        
         rationale_texts = prepare_misra_rationale_texts(guidelines)
         print(f"  Prepared {len(rationale_texts)} rationale texts for embedding")
-        
         if rationale_texts:
-            print("\nGenerating MISRA rationale embeddings...")
-            rationale_embeddings = generate_embeddings(rationale_texts, model)
-            
-            rationale_output = get_standard_rationale_embeddings_path(project_root, "misra-c")
-            
-            with open(rationale_output, 'wb') as f:
-                pickle.dump({
-                    'model': args.model,
-                    'generated_date': str(date.today()),
-                    'num_items': len(rationale_embeddings['ids']),
-                    'embedding_dim': model.get_sentence_embedding_dimension(),
-                    'level': 'rationale',
-                    'data': rationale_embeddings,
-                }, f)
-            print(f"  Saved to: {rationale_output}")
-            print(f"  File size: {rationale_output.stat().st_size / 1024 / 1024:.2f} MB")
+            text_groups['rationale'] = rationale_texts
         else:
             print("  No rationale texts found - skipping")
     else:
         print("\n[Skipping MISRA rationale embeddings]")
     
-    # =========================================================================
-    # MISRA Amplification Embeddings
-    # =========================================================================
     if not args.skip_amplification:
-        print("\n" + "="*60)
-        print("MISRA Amplification Embeddings")
-        print("="*60)
-        
         amplification_texts = prepare_misra_amplification_texts(guidelines)
         print(f"  Prepared {len(amplification_texts)} amplification texts for embedding")
-        
         if amplification_texts:
-            print("\nGenerating MISRA amplification embeddings...")
-            amplification_embeddings = generate_embeddings(amplification_texts, model)
-            
-            amplification_output = get_standard_amplification_embeddings_path(project_root, "misra-c")
-            
-            with open(amplification_output, 'wb') as f:
-                pickle.dump({
-                    'model': args.model,
-                    'generated_date': str(date.today()),
-                    'num_items': len(amplification_embeddings['ids']),
-                    'embedding_dim': model.get_sentence_embedding_dimension(),
-                    'level': 'amplification',
-                    'data': amplification_embeddings,
-                }, f)
-            print(f"  Saved to: {amplification_output}")
-            print(f"  File size: {amplification_output.stat().st_size / 1024 / 1024:.2f} MB")
+            text_groups['amplification'] = amplification_texts
         else:
             print("  No amplification texts found - skipping")
     else:
         print("\n[Skipping MISRA amplification embeddings]")
     
     # =========================================================================
-    # FLS Section Embeddings (Coarse)
+    # FLS texts
     # =========================================================================
     print("\n" + "="*60)
-    print("FLS Section Embeddings (Coarse)")
+    print("FLS Texts")
     print("="*60)
     
     print("\nLoading FLS sections...")
     sections = load_fls_sections(project_root)
     print(f"  Loaded {len(sections)} sections")
     
-    fls_section_texts = prepare_fls_section_texts(sections)
-    print(f"  Prepared {len(fls_section_texts)} section texts for embedding")
+    text_groups['section'] = prepare_fls_section_texts(sections, tokenizer, max_tokens)
+    print(f"  Prepared {len(text_groups['section'])} section texts for embedding")
     
-    print("\nGenerating FLS section embeddings...")
-    fls_section_embeddings = generate_embeddings(fls_section_texts, model)
-    
-    fls_section_output = get_fls_section_embeddings_path(project_root)
-    fls_section_output.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(fls_section_output, 'wb') as f:
-        pickle.dump({
-            'model': args.model,
-            'generated_date': str(date.today()),
-            'num_items': len(fls_section_embeddings['ids']),
-            'embedding_dim': model.get_sentence_embedding_dimension(),
-            'level': 'section',
-            'data': fls_section_embeddings
-        }, f)
-    print(f"  Saved to: {fls_section_output}")
-    print(f"  File size: {fls_section_output.stat().st_size / 1024 / 1024:.2f} MB")
-    
-    # =========================================================================
-    # FLS Paragraph Embeddings (Fine-grained)
-    # =========================================================================
+    para_metadata = {}
     if not args.no_paragraphs:
-        print("\n" + "="*60)
-        print("FLS Paragraph Embeddings (Fine-grained)")
-        print("="*60)
-        
         cat_names = [CATEGORY_NAMES.get(c, str(c)) for c in sorted(include_categories)]
         print(f"\nIncluding categories: {', '.join(cat_names)}")
         
@@ -560,24 +733,77 @@ def main():
         for cat in sorted(cat_counts.keys()):
             print(f"    {CATEGORY_NAMES.get(cat, str(cat))}: {cat_counts[cat]}")
         
-        print("\nGenerating FLS paragraph embeddings...")
-        fls_para_embeddings = generate_embeddings(fls_para_texts, model)
-        
-        fls_para_output = get_fls_paragraph_embeddings_path(project_root)
-        
-        with open(fls_para_output, 'wb') as f:
-            pickle.dump({
-                'model': args.model,
-                'generated_date': str(date.today()),
-                'num_items': len(fls_para_embeddings['ids']),
-                'embedding_dim': model.get_sentence_embedding_dimension(),
-                'level': 'paragraph',
-                'categories_included': sorted(include_categories),
-                'data': fls_para_embeddings,
-                'metadata': para_metadata,
-            }, f)
-        print(f"  Saved to: {fls_para_output}")
-        print(f"  File size: {fls_para_output.stat().st_size / 1024 / 1024:.2f} MB")
+        text_groups['paragraph'] = fls_para_texts
+    
+    # =========================================================================
+    # Encode everything in one pass
+    # =========================================================================
+    print("\n" + "="*60)
+    print("Generating Embeddings")
+    print("="*60)
+    
+    pool = model.start_multi_process_pool() if args.multi_process else None
+    try:
+        embeddings = generate_embeddings_batch(
+            text_groups, model, encode_cache, cache_model, batch_size, pool,
+            fuzzy=args.fuzzy_cache,
+        )
+    finally:
+        if pool is not None:
+            model.stop_multi_process_pool(pool)
+    
+    if encode_cache is not None:
+        save_encode_cache(cache_path, encode_cache)
+        print(f"  Saved encode cache ({len(encode_cache)} entries) to: {cache_path}")
+    
+    # =========================================================================
+    # Save embeddings
+    # =========================================================================
+    print("\n" + "="*60)
+    print("Saving Embeddings")
+    print("="*60)
+    
+    embedding_dim = model.get_sentence_embedding_dimension()
+    
+    # (group name, output path, extra fields after the common header)
+    outputs = [
+        ('guideline', get_standard_embeddings_path(project_root, "misra-c"), {}),
+        ('query', get_standard_query_embeddings_path(project_root, "misra-c"),
+         {'level': 'query'}),
+        ('rationale', get_standard_rationale_embeddings_path(project_root, "misra-c"),
+         {'level': 'rationale'}),
+        ('amplification', get_standard_amplification_embeddings_path(project_root, "misra-c"),
+         {'level': 'amplification'}),
+        ('section', get_fls_section_embeddings_path(project_root),
+         {'level': 'section'}),
+        ('paragraph', get_fls_paragraph_embeddings_path(project_root),
+         {'level': 'paragraph', 'categories_included': sorted(include_categories)}),
+    ]
+    trailing_metadata = {'query': query_metadata, 'paragraph': para_metadata}
+    
+    for name, output_path, extra in outputs:
+        if name not in embeddings:
+            continue
+        data = embeddings[name]
+        data['embeddings'], scale = quantize_embeddings(data['embeddings'], args.embedding_dtype)
+        if scale is not None:
+            data['embedding_scale'] = scale
+        output = {
+            'model': args.model,
+            'generated_date': str(date.today()),
+            'num_items': len(data['ids']),
+            'embedding_dim': embedding_dim,
+            'normalized': True,
+            **extra,
+            'data': data,
+        }
+        if name in trailing_metadata:
+            output['metadata'] = trailing_metadata[name]
+        
+        written = write_embeddings_file(output_path, output, args.format)
+        print(f"\n  {name}: {len(data['ids'])} embeddings")
+        print(f"  Saved to: {', '.join(str(p) for p in written)}")
+        print(f"  File size: {sum(p.stat().st_size for p in written) / 1024 / 1024:.2f} MB")
     
     print("\n" + "="*60)
     print("Done!")
@@ -25,7 +25,6 @@ Output:
 
 import argparse
 import json
-import pickle
 from datetime import date
 from pathlib import Path
 
@@ -42,13 +41,15 @@ from fls_tools.shared import (
     get_fls_paragraph_embeddings_path,
     get_misra_c_similarity_path,
     CATEGORY_NAMES,
+    decode_embeddings,
+    embeddings_exist,
+    read_embeddings_file,
 )
 
 
 def load_embeddings(path: Path) -> dict:
     """Load embeddings from pickle file."""
-    with open(path, 'rb') as f:
-        return pickle.load(f)
+    return read_embeddings_file(path)
 
 
 def load_fls_sections(project_root: Path) -> dict:
@@ -262,12 +263,12 @@ def main():
     fls_section_emb_path = get_fls_section_embeddings_path(project_root)
     fls_para_emb_path = get_fls_paragraph_embeddings_path(project_root)
     
-    if not misra_emb_path.exists():
+    if not embeddings_exist(misra_emb_path):
         print(f"Error: MISRA embeddings not found at {misra_emb_path}")
         print("Run generate_embeddings.py first.")
         return 1
     
-    if not fls_section_emb_path.exists():
+    if not embeddings_exist(fls_section_emb_path):
         print(f"Error: FLS section embeddings not found at {fls_section_emb_path}")
         print("Run generate_embeddings.py first.")
         return 1
@@ -279,7 +280,7 @@ def main():
     print(f"  FLS sections: {fls_section_data['num_items']} items, dim={fls_section_data['embedding_dim']}")
     
     # Check for paragraph embeddings
-    has_paragraphs = fls_para_emb_path.exists()
+    has_paragraphs = embeddings_exist(fls_para_emb_path)
     if has_paragraphs:
         fls_para_data = load_embeddings(fls_para_emb_path)
         print(f"  FLS paragraphs: {fls_para_data['num_items']} items, dim={fls_para_data['embedding_dim']}")
@@ -297,9 +298,9 @@ def main():
     
     # Extract arrays
     misra_ids = misra_data['data']['ids']
-    misra_embeddings = misra_data['data']['embeddings']
+    misra_embeddings = decode_embeddings(misra_data['data'])
     fls_section_ids = fls_section_data['data']['ids']
-    fls_section_embeddings = fls_section_data['data']['embeddings']
+    fls_section_embeddings = decode_embeddings(fls_section_data['data'])
     
     # =========================================================================
     # Section-Level Similarity
@@ -345,7 +346,7 @@ def main():
         print("="*60)
         
         para_ids = fls_para_data['data']['ids']
-        para_embeddings = fls_para_data['data']['embeddings']
+        para_embeddings = decode_embeddings(fls_para_data['data'])
         para_metadata = fls_para_data.get('metadata', {})
         
         print("\nComputing paragraph similarity matrix...")
@@ -25,8 +25,11 @@ Output:
 
 import argparse
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from itertools import repeat
 from pathlib import Path
 
 from pypdf import PdfReader
@@ -34,6 +37,12 @@ from pypdf import PdfReader
 from fls_tools.shared import get_project_root
 
 
+# Worker processes used to extract the guideline table pages
+PDF_EXTRACT_WORKERS = 4
+
+# Characters of the output JSON shown by --dry-run
+DRY_RUN_PREVIEW_CHARS = 2000
+
 # Valid values for validation
 VALID_MISRA_CATEGORIES = {"Required", "Advisory", "Mandatory"}
 VALID_DECIDABILITY = {"Decidable", "Undecidable", "n/a"}
@@ -42,6 +51,48 @@ VALID_RATIONALE = {"UB", "IDB", "CQ", "DC"}
 VALID_APPLICABILITY = {"Yes", "No", "Partial"}
 VALID_ADJUSTED_CATEGORY = {"Required", "Advisory", "Recommended", "Disapplied", "Implicit", "N/A"}
 
+# Canonical instances of the column values, so every parsed row shares one
+# string object per value instead of holding its own regex-group copy
+_CANON = {
+    v: v
+    for v in (VALID_MISRA_CATEGORIES | VALID_DECIDABILITY | VALID_SCOPE
+              | VALID_RATIONALE | VALID_APPLICABILITY)
+}
+# Adjusted Category as stored in the output ("N/A" -> "n_a", others lowercased)
+_ADJUSTED_CATEGORY_KEYS = {
+    v: v.lower() if v != "N/A" else "n_a" for v in VALID_ADJUSTED_CATEGORY
+}
+
+# Guideline ID at the start of a table row (D.X.Y or R.X.Y)
+_GID_RE = re.compile(r'([DR])\.(\d+)\.(\d+)\s+')
+
+
+def _alternation(values: set[str]) -> str:
+    """Regex alternation matching exactly one of the given values."""
+    return "|".join(re.escape(v) for v in sorted(values))
+
+
+# Columns of a table row after the guideline ID, as whitespace-separated tokens:
+#   Category, Decidability, Scope, Rationale..., App(all), App(safe), AdjustedCategory, Comment...
+# Directives use a single "n/a" token for Decidability and Scope. Rationale
+# values continue while they end with a comma ("UB, IDB DC" -> UB, IDB).
+_RATIONALE = _alternation(VALID_RATIONALE)
+_ROW_RE = re.compile(
+    rf'({_alternation(VALID_MISRA_CATEGORIES)})\s+'
+    rf'(?:(n/a)|({_alternation(VALID_DECIDABILITY - {"n/a"})})\s+({_alternation(VALID_SCOPE)}))\s+'
+    rf'((?:(?:{_RATIONALE}),+\s+)*(?:(?:{_RATIONALE})\s+)?)'
+    rf'({_alternation(VALID_APPLICABILITY)})\s+'
+    rf'({_alternation(VALID_APPLICABILITY)})\s+'
+    rf'({_alternation(VALID_ADJUSTED_CATEGORY)})'
+    r'(?:\s+(.*))?\Z',
+    re.DOTALL,
+)
+# Individual values inside the rationale column matched by _ROW_RE
+_RATIONALE_VALUE_RE = re.compile(_RATIONALE)
+
+# Marks a renumbered entry ("Renumbered" is matched case-sensitively)
+_RENUMBERED_RE = re.compile(r'Renumbered|(?i:moved to)')
+
 
 def get_add6_pdf_path(root: Path) -> Path:
     """Get path to ADD-6 PDF."""
@@ -94,23 +145,19 @@ def parse_table_row(line: str) -> dict | None:
     
     Returns dict with parsed fields or None if not a valid row.
     """
-    # Skip header rows and empty lines
-    if not line.strip():
-        return None
-    if line.startswith("Guideline"):
-        return None
-    if line.startswith("MISRA C:2025"):
-        return None
-    if line.startswith("Category"):
+    # Rows start with "D." or "R."; this one-character check rejects empty
+    # lines, headers ("Guideline", "Category", "MISRA C:2025") and prose
+    # before any regex work
+    if line[:1] not in ("D", "R"):
         return None
     
     # Check if line starts with a guideline ID pattern (D.X.Y or R.X.Y)
-    match = re.match(r'^([DR])\.(\d+)\.(\d+)\s+', line)
+    match = _GID_RE.match(line)
     if not match:
         return None
     
     # Handle "Renumbered" entries
-    if "Renumbered" in line or "moved to" in line.lower():
+    if _RENUMBERED_RE.search(line):
         gid = normalize_guideline_id(f"{match.group(1)}.{match.group(2)}.{match.group(3)}")
         return {
             "guideline_id": gid,
@@ -128,108 +175,46 @@ def parse_table_row(line: str) -> dict | None:
     
     rest = line[match.end():].strip()
     
-    # Try to parse using known value patterns
-    # Strategy: extract known values from left to right
-    
-    result = {
-        "guideline_id": normalize_guideline_id(f"{match.group(1)}.{match.group(2)}.{match.group(3)}"),
-        "misra_category": None,
-        "decidability": None,
-        "scope": None,
-        "rationale": [],
-        "applicability_all_rust": None,
-        "applicability_safe_rust": None,
-        "adjusted_category": None,
-        "comment": ""
-    }
-    
-    # Split into tokens
-    tokens = rest.split()
-    # Minimum tokens needed:
-    # - For rules: Category, Decidability, Scope, Rationale, App_all, App_safe, AdjCat = 7
-    # - For directives: Category, n/a, Rationale, App_all, App_safe, AdjCat = 6
-    # Use 6 as minimum to allow directives
-    if len(tokens) < 6:
-        # Not enough tokens for a valid row
-        return None
-    
-    idx = 0
-    
-    # MISRA Category (Required/Advisory/Mandatory)
-    if idx < len(tokens) and tokens[idx] in VALID_MISRA_CATEGORIES:
-        result["misra_category"] = tokens[idx]
-        idx += 1
-    else:
-        return None
-    
-    # Decidability (Decidable/Undecidable/n/a)
-    if idx < len(tokens) and tokens[idx] in VALID_DECIDABILITY:
-        result["decidability"] = tokens[idx]
-        idx += 1
-        
-        # For Directives, n/a is used for BOTH decidability and scope (single token)
-        # For Rules, there are separate Decidability and Scope columns
-        if result["decidability"] == "n/a":
-            # Directives: n/a covers both, so set scope to n/a as well
-            result["scope"] = "n/a"
-        else:
-            # Rules: need to parse separate Scope column
-            if idx < len(tokens) and tokens[idx] in VALID_SCOPE:
-                result["scope"] = tokens[idx]
-                idx += 1
-            else:
-                return None
-    else:
-        return None
-    
-    # Rationale - can be multiple values separated by commas
-    # This is tricky because "UB, IDB" becomes ["UB,", "IDB"] when split
-    rationale_parts = []
-    while idx < len(tokens):
-        token = tokens[idx]
-        # Check if it's a rationale value (possibly with comma)
-        clean_token = token.rstrip(",")
-        if clean_token in VALID_RATIONALE:
-            rationale_parts.append(clean_token)
-            idx += 1
-            # If token didn't end with comma, we're done with rationale
-            if not token.endswith(","):
-                break
-        else:
-            break
-    
-    result["rationale"] = rationale_parts
-    
-    # Applicability (all Rust) - Yes/No/Partial
-    if idx < len(tokens) and tokens[idx] in VALID_APPLICABILITY:
-        result["applicability_all_rust"] = tokens[idx]
-        idx += 1
-    else:
-        return None
-    
-    # Applicability (safe Rust) - Yes/No/Partial
-    if idx < len(tokens) and tokens[idx] in VALID_APPLICABILITY:
-        result["applicability_safe_rust"] = tokens[idx]
-        idx += 1
-    else:
+    # Match all columns in one pass; see _ROW_RE for the column grammar
+    row = _ROW_RE.match(rest)
+    if not row:
         return None
-    
-    # Adjusted Category - Required/Advisory/Recommended/Disapplied/Implicit/N/A
-    if idx < len(tokens):
-        adj_cat = tokens[idx]
-        if adj_cat in VALID_ADJUSTED_CATEGORY:
-            result["adjusted_category"] = adj_cat.lower() if adj_cat != "N/A" else "n_a"
-            idx += 1
-        else:
+    (category, directive_na, decidability, scope, rationale,
+     app_all, app_safe, adj_cat, comment) = row.groups()
+    
+    # For Directives, n/a is used for BOTH decidability and scope (single token)
+    # For Rules, there are separate Decidability and Scope columns
+    if directive_na:
+        # Directive rows need at least one rationale or comment token
+        if not rationale and comment is None:
             return None
-    else:
-        return None
+        decidability = scope = "n/a"
     
-    # Comment - rest of the tokens
-    if idx < len(tokens):
-        result["comment"] = " ".join(tokens[idx:])
+    return {
+        "guideline_id": normalize_guideline_id(f"{match.group(1)}.{match.group(2)}.{match.group(3)}"),
+        "misra_category": _CANON[category],
+        "decidability": _CANON[decidability],
+        "scope": _CANON[scope],
+        # "UB, IDB" -> ["UB", "IDB"]
+        "rationale": [_CANON[r] for r in _RATIONALE_VALUE_RE.findall(rationale)],
+        "applicability_all_rust": _CANON[app_all],
+        "applicability_safe_rust": _CANON[app_safe],
+        "adjusted_category": _ADJUSTED_CATEGORY_KEYS[adj_cat],
+        # Comment - rest of the tokens, single-spaced
+        "comment": " ".join(comment.split()) if comment else "",
+    }
+
+
+def _extract_page_texts(pdf_path: Path, start: int, stop: int) -> list[str]:
+    """
+    Extract the text of PDF pages ``start`` up to ``stop`` (clamped to the page count).
     
-    return result
+    Runs in a worker process; it opens its own PdfReader because pypdf
+    objects cannot be pickled, and reuses it for a contiguous run of pages
+    so the document structure is parsed once per worker rather than per page.
+    """
+    pages = PdfReader(pdf_path).pages
+    return [pages[i].extract_text() for i in range(start, min(stop, len(pages)))]
 
 
 def extract_guidelines_from_pdf(pdf_path: Path) -> list[dict]:
@@ -238,17 +223,29 @@ def extract_guidelines_from_pdf(pdf_path: Path) -> list[dict]:
     
     Returns list of guideline dicts.
     """
-    reader = PdfReader(pdf_path)
-    guidelines = []
-    seen_ids = set()
-    
-    # The guideline table spans pages 11-20 (0-indexed: 10-19)
-    for page_num in range(10, 20):
-        if page_num >= len(reader.pages):
-            break
-        
-        page = reader.pages[page_num]
-        text = page.extract_text()
+    # Insertion-ordered, keyed by guideline ID
+    guidelines_by_id: dict[str, dict] = {}
+    
+    # The guideline table spans pages 11-20 (0-indexed: 10-19); workers clamp
+    # the range to the document length, so the parent never opens the PDF
+    first_page, end_page = 10, 20
+    
+    # Text extraction is CPU-bound pure Python, so spread contiguous page
+    # runs over processes
+    workers = max(1, min(PDF_EXTRACT_WORKERS, os.cpu_count() or 1))
+    run = -(-(end_page - first_page) // workers)
+    starts = range(first_page, end_page, run)
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        page_runs = executor.map(
+            _extract_page_texts,
+            repeat(pdf_path),
+            starts,
+            (min(start + run, end_page) for start in starts),
+        )
+        page_texts = [text for texts in page_runs for text in texts]
+    
+    # Merge in page order so "keep first occurrence" stays deterministic
+    for text in page_texts:
         if not text:
             continue
         
@@ -256,13 +253,10 @@ def extract_guidelines_from_pdf(pdf_path: Path) -> list[dict]:
         for line in text.split("\n"):
             parsed = parse_table_row(line)
             if parsed:
-                gid = parsed["guideline_id"]
                 # Skip duplicates (keep first occurrence)
-                if gid not in seen_ids:
-                    seen_ids.add(gid)
-                    guidelines.append(parsed)
+                guidelines_by_id.setdefault(parsed["guideline_id"], parsed)
     
-    return guidelines
+    return list(guidelines_by_id.values())
 
 
 def build_output_structure(guidelines: list[dict]) -> dict:
@@ -413,13 +407,25 @@ def main():
     
     if args.dry_run:
         print(f"\nDry run - would write to: {output_path}")
-        print(json.dumps(output, indent=2)[:2000] + "\n...")
+        # Encode lazily and stop once the preview is long enough, rather
+        # than serializing the whole output to print its first 2000 chars
+        preview = []
+        preview_len = 0
+        for chunk in json.JSONEncoder(indent=2).iterencode(output):
+            preview.append(chunk)
+            preview_len += len(chunk)
+            if preview_len >= DRY_RUN_PREVIEW_CHARS:
+                break
+        print("".join(preview)[:DRY_RUN_PREVIEW_CHARS] + "\n...")
     else:
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Serialize in one call and write once; json.dump() issues a write
+        # per encoded fragment
+        output_path.write_bytes(
+            json.dumps(output, indent=2, ensure_ascii=False).encode()
+        )
         
         print(f"\nSaved to: {output_path}")
     
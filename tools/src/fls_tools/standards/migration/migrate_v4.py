@@ -23,23 +23,34 @@ Usage:
 
 import argparse
 import json
+import shutil
 import sys
-from copy import deepcopy
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from itertools import repeat
 from pathlib import Path
+from typing import TextIO
 
 from fls_tools.shared import (
     get_project_root,
     get_standard_mappings_path,
     VALID_STANDARDS,
     detect_schema_version,
-    is_v1_family,
+    is_v1_version,
     count_matches_by_category,
     count_context_matches,
     build_migration_waiver,
 )
 
 
+# Mapping files with more entries than this are migrated in worker processes
+PARALLEL_MIGRATION_THRESHOLD = 500
+
+# Paragraph coverage classes, best first
+COVERAGE_CLASSES = ("has_paragraphs", "section_only", "no_matches")
+
+
 def get_new_version(current_version: str) -> str | None:
     """
     Determine the new version for migration.
@@ -63,8 +74,12 @@ def migrate_v1_entry(entry: dict, migration_date: str) -> dict:
     Migrate a v1.x entry to v1.2.
     
     v1 entries have flat structure with accepted_matches at entry level.
+    
+    Only top-level keys are set, so a shallow copy suffices; nested values
+    (e.g. accepted_matches) are shared with the input and must not be
+    mutated by the caller afterwards.
     """
-    entry = deepcopy(entry)
+    entry = dict(entry)
     old_version = entry.get("schema_version", "1.0")
     
     # Get new version
@@ -97,8 +112,12 @@ def migrate_v2_entry(entry: dict, migration_date: str) -> dict:
     Migrate a v2.x or v3.x entry to vX.2.
     
     v2+ entries have per-context structure with accepted_matches in each context.
+    
+    The entry and each updated context dict are shallow-copied; deeper values
+    (e.g. accepted_matches) are shared with the input and must not be mutated
+    by the caller afterwards.
     """
-    entry = deepcopy(entry)
+    entry = dict(entry)
     old_version = entry.get("schema_version", "2.0")
     
     # Get new version
@@ -113,6 +132,7 @@ def migrate_v2_entry(entry: dict, migration_date: str) -> dict:
         ctx_data = entry.get(ctx)
         if not ctx_data:
             continue
+        ctx_data = entry[ctx] = dict(ctx_data)
         
         # Count matches for this context
         matches = ctx_data.get("accepted_matches", [])
@@ -133,119 +153,121 @@ def migrate_v2_entry(entry: dict, migration_date: str) -> dict:
     return entry
 
 
-def migrate_entry(entry: dict, migration_date: str) -> dict:
-    """Migrate a single mapping entry to vX.2."""
-    version = detect_schema_version(entry)
+def migrate_entry(entry: dict, migration_date: str, version: str | None = None) -> dict:
+    """
+    Migrate a single mapping entry to vX.2.
     
-    if is_v1_family(entry):
+    `version` is the entry's detect_schema_version(), if the caller already
+    has it.
+    """
+    if version is None:
+        version = detect_schema_version(entry)
+    
+    if is_v1_version(version):
         return migrate_v1_entry(entry, migration_date)
     else:
         return migrate_v2_entry(entry, migration_date)
 
 
+def classify_matches(matches: list[dict]) -> str:
+    """
+    Classify accepted matches by coverage.
+    
+    Returns one of COVERAGE_CLASSES: "has_paragraphs" if any match is a
+    paragraph, "section_only" if there are only section matches, otherwise
+    "no_matches".
+    """
+    para_count, section_count = count_matches_by_category(matches)
+    if para_count > 0:
+        return "has_paragraphs"
+    if section_count > 0:
+        return "section_only"
+    return "no_matches"
+
+
 def compute_stats(entries: list[dict]) -> dict:
     """
     Compute migration statistics.
     
     Returns dict with:
-    - version_counts: count by version before migration
+    - version_counts: count by version before migration, in version order
     - paragraph_stats: has_paragraphs, section_only, no_matches
     - per_context_stats: for v2+ entries
-    - needs_reverification: list of guideline_ids
+    - needs_reverification: sorted list of guideline_ids
+    - no_matches_entries: sorted list of guideline_ids
     """
-    stats = {
+    versions = [detect_schema_version(entry) for entry in entries]
+    
+    # Classify each entry (and each context of v2+ entries) once, then tally
+    entry_classes = []
+    context_classes = []
+    for entry, version in zip(entries, versions, strict=True):
+        if is_v1_version(version):
+            # v1 flat structure
+            entry_classes.append(classify_matches(entry.get("accepted_matches", [])))
+            continue
+        
+        # v2+ per-context structure: the entry takes its best context's class
+        ctx_classes = [
+            (ctx, classify_matches(ctx_data.get("accepted_matches", [])))
+            for ctx in ("all_rust", "safe_rust")
+            if (ctx_data := entry.get(ctx, {}))
+        ]
+        context_classes.extend(ctx_classes)
+        entry_classes.append(
+            min((cls for _, cls in ctx_classes), key=COVERAGE_CLASSES.index, default="no_matches")
+        )
+    
+    entry_counts = Counter(entry_classes)
+    context_counts = Counter(context_classes)
+    
+    return {
         "total": len(entries),
-        "version_counts": {},
-        "paragraph_stats": {
-            "has_paragraphs": 0,
-            "section_only": 0,
-            "no_matches": 0,
-        },
+        "version_counts": dict(sorted(Counter(versions).items())),
+        "paragraph_stats": {cls: entry_counts[cls] for cls in COVERAGE_CLASSES},
         "per_context_stats": {
-            "all_rust": {"has_paragraphs": 0, "section_only": 0, "no_matches": 0},
-            "safe_rust": {"has_paragraphs": 0, "section_only": 0, "no_matches": 0},
+            ctx: {cls: context_counts[ctx, cls] for cls in COVERAGE_CLASSES}
+            for ctx in ("all_rust", "safe_rust")
         },
-        "needs_reverification": [],
-        "no_matches_entries": [],
+        "needs_reverification": sorted(
+            entry.get("guideline_id", "UNKNOWN")
+            for entry, cls in zip(entries, entry_classes, strict=True)
+            if cls == "section_only"
+        ),
+        "no_matches_entries": sorted(
+            entry.get("guideline_id", "UNKNOWN")
+            for entry, cls in zip(entries, entry_classes, strict=True)
+            if cls == "no_matches"
+        ),
     }
-    
-    for entry in entries:
-        gid = entry.get("guideline_id", "UNKNOWN")
-        version = detect_schema_version(entry)
-        
-        # Count versions
-        stats["version_counts"][version] = stats["version_counts"].get(version, 0) + 1
-        
-        # Check paragraph coverage
-        if is_v1_family(entry):
-            # v1 flat structure
-            matches = entry.get("accepted_matches", [])
-            para_count, section_count = count_matches_by_category(matches)
-            
-            if para_count > 0:
-                stats["paragraph_stats"]["has_paragraphs"] += 1
-            elif section_count > 0:
-                stats["paragraph_stats"]["section_only"] += 1
-                stats["needs_reverification"].append(gid)
-            else:
-                stats["paragraph_stats"]["no_matches"] += 1
-                stats["no_matches_entries"].append(gid)
-        else:
-            # v2+ per-context structure
-            entry_has_para = False
-            entry_has_section = False
-            entry_has_any = False
-            
-            for ctx in ["all_rust", "safe_rust"]:
-                ctx_data = entry.get(ctx, {})
-                if not ctx_data:
-                    continue
-                
-                matches = ctx_data.get("accepted_matches", [])
-                para_count, section_count = count_matches_by_category(matches)
-                
-                if para_count > 0:
-                    stats["per_context_stats"][ctx]["has_paragraphs"] += 1
-                    entry_has_para = True
-                    entry_has_any = True
-                elif section_count > 0:
-                    stats["per_context_stats"][ctx]["section_only"] += 1
-                    entry_has_section = True
-                    entry_has_any = True
-                else:
-                    stats["per_context_stats"][ctx]["no_matches"] += 1
-            
-            # Entry-level classification
-            if entry_has_para:
-                stats["paragraph_stats"]["has_paragraphs"] += 1
-            elif entry_has_section:
-                stats["paragraph_stats"]["section_only"] += 1
-                stats["needs_reverification"].append(gid)
-            elif not entry_has_any:
-                stats["paragraph_stats"]["no_matches"] += 1
-                stats["no_matches_entries"].append(gid)
-    
-    return stats
 
 
 def generate_report(
+    out: TextIO,
     stats_before: dict,
     stats_after: dict,
     migration_date: str,
     standard: str,
-) -> str:
-    """Generate a Markdown migration report."""
-    lines = [
-        f"# v4 Migration Report: {standard}",
-        "",
-        f"**Date:** {migration_date}",
-        f"**Total entries:** {stats_before['total']}",
-        "",
-        "## Summary",
-        "",
-        "| Category | Count | Percentage |",
-        "|----------|-------|------------|",
-    ]
+) -> None:
+    """
+    Write a Markdown migration report to `out`.
+    
+    The report is streamed piece by piece rather than built in memory; it
+    does not end with a newline.
+    """
+    w = out.write
+    
+    w(
+        f"# v4 Migration Report: {standard}\n"
+        "\n"
+        f"**Date:** {migration_date}\n"
+        f"**Total entries:** {stats_before['total']}\n"
+        "\n"
+        "## Summary\n"
+        "\n"
+        "| Category | Count | Percentage |\n"
+        "|----------|-------|------------|"
+    )
     
     total = stats_before["total"]
     for key, label in [
@@ -255,73 +277,69 @@ def generate_report(
     ]:
         count = stats_before["paragraph_stats"][key]
         pct = (count / total * 100) if total > 0 else 0
-        lines.append(f"| {label} | {count} | {pct:.1f}% |")
-    
-    lines.extend([
-        "",
-        "## Version Distribution",
-        "",
-        "### Before Migration",
-        "",
-        "| Version | Count |",
-        "|---------|-------|",
-    ])
-    
-    for version, count in sorted(stats_before["version_counts"].items()):
-        lines.append(f"| v{version} | {count} |")
-    
-    lines.extend([
-        "",
-        "### After Migration",
-        "",
-        "| Version | Count |",
-        "|---------|-------|",
-    ])
-    
-    for version, count in sorted(stats_after["version_counts"].items()):
-        lines.append(f"| v{version} | {count} |")
+        w(f"\n| {label} | {count} | {pct:.1f}% |")
+    
+    w(
+        "\n"
+        "\n## Version Distribution\n"
+        "\n"
+        "### Before Migration\n"
+        "\n"
+        "| Version | Count |\n"
+        "|---------|-------|"
+    )
+    
+    for version, count in stats_before["version_counts"].items():
+        w(f"\n| v{version} | {count} |")
+    
+    w(
+        "\n"
+        "\n### After Migration\n"
+        "\n"
+        "| Version | Count |\n"
+        "|---------|-------|"
+    )
+    
+    for version, count in stats_after["version_counts"].items():
+        w(f"\n| v{version} | {count} |")
     
     # Per-context summary for v2+ entries
-    lines.extend([
-        "",
-        "## Per-Context Summary (v2+ entries)",
-        "",
-        "| Context | Has Paragraphs | Section-Only | No Matches |",
-        "|---------|----------------|--------------|------------|",
-    ])
+    w(
+        "\n"
+        "\n## Per-Context Summary (v2+ entries)\n"
+        "\n"
+        "| Context | Has Paragraphs | Section-Only | No Matches |\n"
+        "|---------|----------------|--------------|------------|"
+    )
     
     for ctx in ["all_rust", "safe_rust"]:
         ctx_stats = stats_before["per_context_stats"][ctx]
-        lines.append(
-            f"| {ctx} | {ctx_stats['has_paragraphs']} | "
+        w(
+            f"\n| {ctx} | {ctx_stats['has_paragraphs']} | "
             f"{ctx_stats['section_only']} | {ctx_stats['no_matches']} |"
         )
     
     # Entries needing re-verification
     if stats_before["needs_reverification"]:
-        lines.extend([
-            "",
-            "## Entries Requiring Re-verification",
-            "",
-            "These entries have only section-level matches and need paragraph-level content added:",
-            "",
-        ])
-        for gid in sorted(stats_before["needs_reverification"]):
-            lines.append(f"- {gid}")
+        w(
+            "\n"
+            "\n## Entries Requiring Re-verification\n"
+            "\n"
+            "These entries have only section-level matches and need paragraph-level content added:\n"
+        )
+        for gid in stats_before["needs_reverification"]:
+            w(f"\n- {gid}")
     
     # Entries with no matches
     if stats_before["no_matches_entries"]:
-        lines.extend([
-            "",
-            "## Entries With No Matches",
-            "",
-            "These entries have no FLS matches (likely `no_equivalent` rationale):",
-            "",
-        ])
-        for gid in sorted(stats_before["no_matches_entries"]):
-            lines.append(f"- {gid}")
-    
-    return "\n".join(lines)
+        w(
+            "\n"
+            "\n## Entries With No Matches\n"
+            "\n"
+            "These entries have no FLS matches (likely `no_equivalent` rationale):\n"
+        )
+        for gid in stats_before["no_matches_entries"]:
+            w(f"\n- {gid}")
 
 
 def main():
@@ -376,8 +394,7 @@ def main():
         sys.exit(1)
     
     print(f"Loading mappings from {mapping_path}", file=sys.stderr)
-    with open(mapping_path) as f:
-        mappings = json.load(f)
+    mappings = json.loads(mapping_path.read_bytes())
     
     entries = mappings.get("mappings", [])
     print(f"Found {len(entries)} mapping entries", file=sys.stderr)
@@ -396,12 +413,23 @@ def main():
         "3.1→3.2": 0,
         "unchanged": 0,
     }
+    version_counts_after = {}
+    
+    # Entries are independent; fan large mapping files out over processes
+    old_versions = [detect_schema_version(entry) for entry in entries]
+    dates = repeat(migration_date)
+    if len(entries) > PARALLEL_MIGRATION_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            migrated_all = list(
+                executor.map(migrate_entry, entries, dates, old_versions, chunksize=64)
+            )
+    else:
+        migrated_all = list(map(migrate_entry, entries, dates, old_versions))
     
-    for entry in entries:
-        old_version = detect_schema_version(entry)
-        migrated = migrate_entry(entry, migration_date)
+    for old_version, migrated in zip(old_versions, migrated_all, strict=True):
         new_version = detect_schema_version(migrated)
         migrated_entries.append(migrated)
+        version_counts_after[new_version] = version_counts_after.get(new_version, 0) + 1
         
         if old_version != new_version:
             key = f"{old_version}→{new_version}"
@@ -409,11 +437,10 @@ def main():
         else:
             migration_counts["unchanged"] += 1
     
-    # Compute stats after migration
-    stats_after = compute_stats(migrated_entries)
-    
-    # Generate report
-    report = generate_report(stats_before, stats_after, migration_date, args.standard)
+    # Stats after migration: migration only adds count/waiver fields and keeps
+    # each entry in its schema family, so the match-based coverage stats are
+    # unchanged and only the version distribution needs recounting
+    stats_after = {**stats_before, "version_counts": dict(sorted(version_counts_after.items()))}
     
     # Print migration summary
     print(f"\n{'='*60}", file=sys.stderr)
@@ -432,33 +459,32 @@ def main():
     if args.report or args.dry_run:
         if args.output_report:
             with open(args.output_report, "w") as f:
-                f.write(report)
+                generate_report(f, stats_before, stats_after, migration_date, args.standard)
             print(f"\nReport written to {args.output_report}", file=sys.stderr)
         else:
-            print("\n" + report)
+            sys.stdout.write("\n")
+            generate_report(sys.stdout, stats_before, stats_after, migration_date, args.standard)
+            sys.stdout.write("\n")
     
     if args.dry_run:
         print("\n[DRY RUN] No files were modified.", file=sys.stderr)
         return
     
     if args.apply:
-        # Create backup
+        # Create backup (a byte-for-byte copy; the file is not rewritten until below)
         backup_path = mapping_path.with_suffix(f".json.backup.{migration_date}")
-        with open(backup_path, "w") as f:
-            json.dump(mappings, f, indent=2)
+        shutil.copyfile(mapping_path, backup_path)
         print(f"\nBackup created: {backup_path}", file=sys.stderr)
         
         # Write migrated mappings
         mappings["mappings"] = migrated_entries
-        with open(mapping_path, "w") as f:
-            json.dump(mappings, f, indent=2)
-            f.write("\n")
+        mapping_path.write_bytes((json.dumps(mappings, indent=2) + "\n").encode())
         print(f"Migration applied to {mapping_path}", file=sys.stderr)
         
         # Write report
         if args.output_report:
             with open(args.output_report, "w") as f:
-                f.write(report)
+                generate_report(f, stats_before, stats_after, migration_date, args.standard)
             print(f"Report written to {args.output_report}", file=sys.stderr)
         
         print("\nDone. Run validate-standards to verify migration.", file=sys.stderr)
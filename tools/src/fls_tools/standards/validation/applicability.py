@@ -20,30 +20,60 @@ Exit Codes:
     2 - Semantic validation failed
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import sys
+from collections import Counter
 from pathlib import Path
-
-import jsonschema
+from typing import TYPE_CHECKING
 
 from fls_tools.shared import get_project_root, get_coding_standards_dir
 
+# jsonschema is imported when a validator is first built, so it is not
+# loaded on paths that exit before schema validation
+if TYPE_CHECKING:
+    import jsonschema
+
+
+# Rationale codes tallied in the semantic validation summary
+RATIONALE_KEYS = frozenset({"UB", "IDB", "CQ", "DC"})
+
 
 def load_json(path: Path) -> dict:
     """Load a JSON file."""
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return json.loads(path.read_bytes())
+
+
+def build_validator(schema: dict) -> jsonschema.protocols.Validator:
+    """
+    Check a JSON schema and build a validator for it.
+    
+    main() builds one validator per run and passes it to validate_schema().
+    
+    Raises jsonschema.SchemaError if the schema itself is invalid.
+    """
+    import jsonschema
+    
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
 
 
-def validate_schema(data: dict, schema: dict) -> list[str]:
+def validate_schema(
+    data: dict,
+    schema: dict | jsonschema.protocols.Validator,
+) -> list[str]:
     """
     Validate data against JSON schema.
     
+    `schema` may be the schema dict or a validator from build_validator().
+    
     Returns list of error messages (empty if valid).
     """
     errors = []
-    validator = jsonschema.Draft202012Validator(schema)
+    validator = build_validator(schema) if isinstance(schema, dict) else schema
     
     for error in validator.iter_errors(data):
         path = ".".join(str(p) for p in error.absolute_path)
@@ -62,73 +92,64 @@ def validate_semantics(data: dict, verbose: bool = False) -> list[str]:
     Returns list of error messages (empty if valid).
     """
     errors = []
-    warnings = []
+    summary = []  # verbose output lines
     
     guidelines = data.get("guidelines", {})
     
-    # Count guidelines by type
+    # Tally guideline types, rationale and adjusted categories in one pass
     regular_count = 0
     renumbered_count = 0
-    directives = []
-    rules = []
+    directive_count = 0
+    rule_count = 0
+    rationale_counts = Counter()
+    # Only the first few guidelines without rationale are listed
+    without_rationale_count = 0
+    without_rationale_shown = []
+    adj_cat_counts = Counter()
     
     for gid, gdata in guidelines.items():
         if gdata.get("renumbered"):
             renumbered_count += 1
-        else:
-            regular_count += 1
-            if gid.startswith("Dir"):
-                directives.append(gid)
-            else:
-                rules.append(gid)
-    
-    if verbose:
-        print(f"  Regular guidelines: {regular_count}")
-        print(f"  Renumbered entries: {renumbered_count}")
-        print(f"  Directives: {len(directives)}")
-        print(f"  Rules: {len(rules)}")
-    
-    # Check rationale distribution
-    rationale_counts = {"UB": 0, "IDB": 0, "CQ": 0, "DC": 0}
-    guidelines_without_rationale = []
-    
-    for gid, gdata in guidelines.items():
-        if gdata.get("renumbered"):
             continue
         
+        regular_count += 1
+        if gid.startswith("Dir"):
+            directive_count += 1
+        else:
+            rule_count += 1
+        
         rationale = gdata.get("rationale", [])
         if not rationale:
-            guidelines_without_rationale.append(gid)
+            without_rationale_count += 1
+            if without_rationale_count <= 5:
+                without_rationale_shown.append(gid)
         else:
-            for r in rationale:
-                if r in rationale_counts:
-                    rationale_counts[r] += 1
+            rationale_counts.update(r for r in rationale if r in RATIONALE_KEYS)
+        
+        adj_cat_counts[gdata.get("adjusted_category", "unknown")] += 1
     
     if verbose:
-        print(f"\n  Rationale distribution:")
-        for r, count in sorted(rationale_counts.items()):
-            print(f"    {r}: {count}")
+        summary.append(f"  Regular guidelines: {regular_count}")
+        summary.append(f"  Renumbered entries: {renumbered_count}")
+        summary.append(f"  Directives: {directive_count}")
+        summary.append(f"  Rules: {rule_count}")
+        
+        summary.append(f"\n  Rationale distribution:")
+        for r in sorted(RATIONALE_KEYS):
+            summary.append(f"    {r}: {rationale_counts[r]}")
     
     # Warnings for guidelines without rationale (not errors)
-    if guidelines_without_rationale and verbose:
-        print(f"\n  Guidelines without rationale: {len(guidelines_without_rationale)}")
-        for gid in guidelines_without_rationale[:5]:
-            print(f"    - {gid}")
-        if len(guidelines_without_rationale) > 5:
-            print(f"    ... and {len(guidelines_without_rationale) - 5} more")
-    
-    # Check adjusted category distribution
-    adj_cat_counts = {}
-    for gid, gdata in guidelines.items():
-        if gdata.get("renumbered"):
-            continue
-        cat = gdata.get("adjusted_category", "unknown")
-        adj_cat_counts[cat] = adj_cat_counts.get(cat, 0) + 1
+    if without_rationale_count and verbose:
+        summary.append(f"\n  Guidelines without rationale: {without_rationale_count}")
+        for gid in without_rationale_shown:
+            summary.append(f"    - {gid}")
+        if without_rationale_count > 5:
+            summary.append(f"    ... and {without_rationale_count - 5} more")
     
     if verbose:
-        print(f"\n  Adjusted category distribution:")
+        summary.append(f"\n  Adjusted category distribution:")
         for cat, count in sorted(adj_cat_counts.items()):
-            print(f"    {cat}: {count}")
+            summary.append(f"    {cat}: {count}")
     
     # Check metadata consistency
     total_in_metadata = data.get("metadata", {}).get("total_guidelines", 0)
@@ -139,14 +160,15 @@ def validate_semantics(data: dict, verbose: bool = False) -> list[str]:
             f"actual guideline count ({actual_total})"
         )
     
-    # Check for expected guideline count (MISRA C:2025 has ~228 guidelines)
-    if actual_total < 200:
-        warnings.append(f"Only {actual_total} guidelines found (expected ~228)")
+    # Check for expected guideline count (MISRA C:2025 has ~228 guidelines);
+    # this is only a warning, shown in verbose mode
+    if actual_total < 200 and verbose:
+        summary.append(f"\n  Warnings:")
+        summary.append(f"    - Only {actual_total} guidelines found (expected ~228)")
     
-    if verbose and warnings:
-        print(f"\n  Warnings:")
-        for w in warnings:
-            print(f"    - {w}")
+    # Emit the verbose summary in one write rather than a print per line
+    if summary:
+        sys.stdout.write("\n".join(summary) + "\n")
     
     return errors
 
@@ -203,10 +225,11 @@ def main():
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON: {e}")
         return 1
+    validator = build_validator(schema)
     
     # Schema validation
     print("\n1. Schema validation...")
-    schema_errors = validate_schema(data, schema)
+    schema_errors = validate_schema(data, validator)
     
     if schema_errors:
         print(f"   FAILED - {len(schema_errors)} error(s)")
@@ -24,13 +24,17 @@ Usage:
         --batch-report cache/verification/misra-c/batch4_session6.json
 """
 
+from __future__ import annotations
+
 import argparse
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-
-import jsonschema
+from typing import TYPE_CHECKING
 
 from fls_tools.shared import (
     get_project_root, 
@@ -39,13 +43,37 @@ from fls_tools.shared import (
     validate_paragraph_coverage_context,
 )
 
+# jsonschema is imported where a schema is actually checked: it takes a
+# noticeable share of startup and is not needed when the schema is missing
+if TYPE_CHECKING:
+    import jsonschema
+
+
+# Valid FLS ID format (ASCII letters/digits after the prefix, no trailing newline)
+FLS_ID_PATTERN = re.compile(r"^fls_[a-zA-Z0-9]+\Z", re.ASCII)
+
+# Schema versions with per-context (all_rust/safe_rust) structure
+PER_CONTEXT_VERSIONS = frozenset({"2.0", "2.1", "2.2", "3.0", "3.1", "3.2", "4.0"})
+# Versions with enforced paragraph coverage
+PARAGRAPH_VERSIONS = frozenset({"3.2", "4.0"})
+
+# Stand-in for a missing context; shared, so it must never be mutated
+_NO_CONTEXT: dict = {}
+
+# Directories with more decision files than this are validated in worker processes
+PARALLEL_VALIDATION_THRESHOLD = 200
+
+# Per-process state for worker validation, set up by _init_validation_worker
+_worker_validator = None
+_worker_batch_guideline_ids = None
+_worker_fast_fail = False
+
 
 def load_json(path: Path) -> dict | None:
     """Load a JSON file, returning None on error."""
     try:
-        with open(path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
+        return json.loads(path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
         return None
 
 
@@ -58,8 +86,33 @@ def load_schema(root: Path) -> dict | None:
     return load_json(schema_path)
 
 
+@lru_cache(maxsize=8)
+def _cached_validator(schema_key: str) -> jsonschema.protocols.Validator:
+    """Check and compile a schema given as canonical JSON text."""
+    import jsonschema
+    
+    schema = json.loads(schema_key)
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def build_validator(schema: dict) -> jsonschema.protocols.Validator:
+    """
+    Check the decision file schema once and build a reusable validator for it.
+    
+    Validators are cached by the schema's content, so callers that pass the
+    schema dict to validate_decision_file() for each file share one instance.
+    
+    Raises jsonschema.SchemaError if the schema itself is invalid.
+    """
+    # Plain json.dumps key (no xxhash/orjson dependency): directory validation passes a prebuilt validator
+    return _cached_validator(json.dumps(schema, sort_keys=True))
+
+
 def guideline_id_to_filename(guideline_id: str) -> str:
     """Convert guideline ID to expected filename."""
+    # str.replace beats a str.translate table for a single-character swap
     return guideline_id.replace(" ", "_") + ".json"
 
 
@@ -72,12 +125,20 @@ def filename_to_guideline_id(filename: str) -> str:
 
 def validate_decision_file(
     path: Path,
-    schema: dict | None,
-    batch_guideline_ids: set[str] | None = None,
+    schema: dict | jsonschema.protocols.Validator | None,
+    batch_guideline_ids: frozenset[str] | None = None,
+    fast_fail: bool = False,
 ) -> tuple[bool, list[str], dict | None]:
     """
     Validate a single decision file.
     
+    `schema` may be the schema dict or a validator from build_validator();
+    pass a validator when checking many files so the schema is only
+    checked and compiled once.
+    
+    With `fast_fail`, a file whose name does not match its guideline_id is
+    reported with only the filename error, skipping schema and match checks.
+    
     Returns:
         (is_valid, errors, parsed_data)
     """
@@ -89,21 +150,32 @@ def validate_decision_file(
         errors.append(f"Failed to parse JSON")
         return False, errors, None
     
+    # Filename consistency (reported after any schema error unless failing fast)
+    name = path.name
+    expected_filename = guideline_id_to_filename(data.get("guideline_id", ""))
+    filename_error = None
+    if name != expected_filename:
+        filename_error = (
+            f"Filename mismatch: file is '{name}' but guideline_id suggests '{expected_filename}'"
+        )
+        if fast_fail:
+            errors.append(filename_error)
+            return False, errors, data
+    
     # Schema validation
     if schema:
-        try:
-            jsonschema.validate(instance=data, schema=schema)
-        except jsonschema.ValidationError as e:
+        import jsonschema
+        
+        validator = build_validator(schema) if isinstance(schema, dict) else schema
+        # Report the same single error jsonschema.validate() would raise
+        e = jsonschema.exceptions.best_match(validator.iter_errors(data))
+        if e is not None:
             errors.append(f"Schema error: {e.message}")
             if e.path:
                 errors.append(f"  Path: {'.'.join(str(p) for p in e.path)}")
     
-    # Filename consistency
-    expected_filename = guideline_id_to_filename(data.get("guideline_id", ""))
-    if path.name != expected_filename:
-        errors.append(
-            f"Filename mismatch: file is '{path.name}' but guideline_id suggests '{expected_filename}'"
-        )
+    if filename_error:
+        errors.append(filename_error)
     
     # Check guideline exists in batch report
     if batch_guideline_ids is not None:
@@ -114,41 +186,39 @@ def validate_decision_file(
     # Detect schema version
     schema_version = data.get("schema_version", "1.0")
     
-    # Per-context versions
-    per_context_versions = ("2.0", "2.1", "2.2", "3.0", "3.1", "3.2", "4.0")
-    paragraph_versions = ("3.2", "4.0")  # Versions with enforced paragraph coverage
-    
     # Validate FLS IDs format - handle v1 and v2+ structures
-    fls_id_pattern = re.compile(r"^fls_[a-zA-Z0-9]+$")
+    add_error = errors.append
+    match_fls_id = FLS_ID_PATTERN.match
     
     def validate_matches(matches: list, prefix: str) -> None:
         """Validate FLS matches in a list."""
         for i, match in enumerate(matches):
             fls_id = match.get("fls_id", "")
-            if not fls_id_pattern.match(fls_id):
-                errors.append(f"{prefix}[{i}]: Invalid fls_id format '{fls_id}'")
+            if not match_fls_id(fls_id):
+                add_error(f"{prefix}[{i}]: Invalid fls_id format '{fls_id}'")
             
             reason = match.get("reason", "")
             if not reason or not reason.strip():
-                errors.append(f"{prefix}[{i}]: Empty reason field")
+                add_error(f"{prefix}[{i}]: Empty reason field")
     
-    if schema_version in per_context_versions:
+    if schema_version in PER_CONTEXT_VERSIONS:
         # v2.x/v3.x/v4.x: validate each context
-        for context in ["all_rust", "safe_rust"]:
-            ctx_data = data.get(context, {})
-            validate_matches(ctx_data.get("accepted_matches", []), f"{context}.accepted_matches")
-            validate_matches(ctx_data.get("rejected_matches", []), f"{context}.rejected_matches")
+        check_paragraphs = schema_version in PARAGRAPH_VERSIONS
+        for context in ("all_rust", "safe_rust"):
+            ctx_data = data.get(context, _NO_CONTEXT)
+            accepted = ctx_data.get("accepted_matches", ())
+            validate_matches(accepted, f"{context}.accepted_matches")
+            validate_matches(ctx_data.get("rejected_matches", ()), f"{context}.rejected_matches")
             
             # Validate paragraph coverage for v3.2/v4.0
-            if schema_version in paragraph_versions and ctx_data.get("decision"):
+            if check_paragraphs and ctx_data.get("decision"):
                 para_errors = validate_paragraph_coverage_context(
                     context, ctx_data, schema_version, strict=True
                 )
                 errors.extend(para_errors)
                 
                 # Validate stored counts match actual counts
-                matches = ctx_data.get("accepted_matches", [])
-                actual_para, actual_section = count_matches_by_category(matches)
+                actual_para, actual_section = count_matches_by_category(accepted)
                 stored_para = ctx_data.get("paragraph_match_count")
                 stored_section = ctx_data.get("section_match_count")
                 
@@ -158,46 +228,126 @@ def validate_decision_file(
                     errors.append(f"{context}: section_match_count={stored_section} but actual={actual_section}")
     else:
         # v1.x: flat structure
-        validate_matches(data.get("accepted_matches", []), "accepted_matches")
-        validate_matches(data.get("rejected_matches", []), "rejected_matches")
+        validate_matches(data.get("accepted_matches", ()), "accepted_matches")
+        validate_matches(data.get("rejected_matches", ()), "rejected_matches")
     
     is_valid = len(errors) == 0
     return is_valid, errors, data
 
 
+def _init_validation_worker(
+    schema: dict | None,
+    batch_guideline_ids: frozenset[str] | None,
+    fast_fail: bool,
+) -> None:
+    """Build the validator in each worker process rather than pickling it."""
+    global _worker_validator, _worker_batch_guideline_ids, _worker_fast_fail
+    _worker_validator = build_validator(schema) if schema else None
+    _worker_batch_guideline_ids = batch_guideline_ids
+    _worker_fast_fail = fast_fail
+
+
+def summarize_decision(data: dict | None) -> dict | None:
+    """
+    Reduce a parsed decision file to the fields directory validation tallies.
+    
+    Returns None for an unparsed or empty file, otherwise guideline_id,
+    schema_version and whether each context has a decision (a v1.x decision
+    counts for both contexts).
+    """
+    if not data:
+        return None
+    
+    gid = data.get("guideline_id")
+    schema_version = data.get("schema_version", "1.0")
+    all_rust_decided = safe_rust_decided = False
+    if gid:
+        if schema_version in PER_CONTEXT_VERSIONS:
+            all_rust_decided = bool(data.get("all_rust", {}).get("decision"))
+            safe_rust_decided = bool(data.get("safe_rust", {}).get("decision"))
+        else:
+            all_rust_decided = safe_rust_decided = bool(data.get("decision"))
+    
+    return {
+        "guideline_id": gid,
+        "schema_version": schema_version,
+        "all_rust_decided": all_rust_decided,
+        "safe_rust_decided": safe_rust_decided,
+    }
+
+
+def _validate_decision_file_in_worker(path: Path) -> tuple[bool, list[str], dict | None]:
+    """Validate one decision file with the worker's validator.
+    
+    Only the summary of the parsed file is sent back, not the whole document.
+    """
+    is_valid, errors, data = validate_decision_file(
+        path, _worker_validator, _worker_batch_guideline_ids, _worker_fast_fail
+    )
+    return is_valid, errors, summarize_decision(data)
+
+
 def validate_decisions_directory(
     decisions_dir: Path,
     schema: dict | None,
     batch_report_path: Path | None = None,
+    fast_fail: bool = False,
 ) -> dict:
     """
     Validate all decision files in a directory.
     
+    `fast_fail` is passed to validate_decision_file().
+    
     Returns dict with:
         valid_count, invalid_count, errors_by_file, guideline_ids,
-        v2 per-context stats: all_rust_decided, safe_rust_decided, both_decided
+        v2 per-context stats: all_rust_decided, safe_rust_decided, both_decided,
+        batch_guideline_ids (None unless a batch report was loaded)
     """
     # Load batch report for cross-reference if provided
     batch_guideline_ids = None
     if batch_report_path and batch_report_path.exists():
         batch_report = load_json(batch_report_path)
         if batch_report:
-            batch_guideline_ids = {
-                g["guideline_id"] for g in batch_report.get("guidelines", [])
-            }
+            batch_guideline_ids = frozenset(
+                g["guideline_id"] for g in batch_report.get("guidelines", ())
+            )
+    
+    # Find all decision files (one directory read, no pattern matching)
+    with os.scandir(decisions_dir) as it:
+        decision_files = sorted(
+            Path(entry.path) for entry in it
+            if entry.name.endswith(".json") and entry.is_file()
+        )
     
-    # Find all decision files
-    decision_files = sorted(decisions_dir.glob("*.json"))
+    # Check and compile the schema once for all files. Workers build their
+    # own copy, but checking here too means an invalid schema raises
+    # SchemaError in this process rather than breaking the pool
+    validator = build_validator(schema) if schema else None
+    
+    # Files are independent; fan large directories out over processes. The
+    # results come back in file order, so duplicate detection below still
+    # attributes each guideline_id to the first file that has it.
+    if len(decision_files) > PARALLEL_VALIDATION_THRESHOLD:
+        with ProcessPoolExecutor(
+            initializer=_init_validation_worker,
+            initargs=(schema, batch_guideline_ids, fast_fail),
+        ) as executor:
+            results = list(
+                executor.map(_validate_decision_file_in_worker, decision_files, chunksize=16)
+            )
+    else:
+        results = []
+        for path in decision_files:
+            is_valid, errors, data = validate_decision_file(
+                path, validator, batch_guideline_ids, fast_fail
+            )
+            results.append((is_valid, errors, summarize_decision(data)))
     
     valid_count = 0
     invalid_count = 0
     errors_by_file = []
-    all_guideline_ids = set()
     guideline_id_to_file = {}
     
-    # Per-context versions
-    per_context_versions = ("2.0", "2.1", "2.2", "3.0", "3.1", "3.2", "4.0")
-    
     # v2+ per-context tracking
     all_rust_decided = set()
     safe_rust_decided = set()
@@ -206,62 +356,52 @@ def validate_decisions_directory(
     v2_count = 0
     version_counts = {}
     
-    for path in decision_files:
-        is_valid, errors, data = validate_decision_file(path, schema, batch_guideline_ids)
+    for path, (is_valid, errors, summary) in zip(decision_files, results, strict=True):
+        name = path.name
         
-        if data:
-            gid = data.get("guideline_id")
-            schema_version = data.get("schema_version", "1.0")
+        if summary:
+            gid = summary["guideline_id"]
+            schema_version = summary["schema_version"]
             version_counts[schema_version] = version_counts.get(schema_version, 0) + 1
             
             if gid:
-                # Check for duplicates
-                if gid in all_guideline_ids:
-                    errors.append(
-                        f"Duplicate guideline_id '{gid}' - also in {guideline_id_to_file[gid]}"
-                    )
+                # Check for duplicates (the first file with a guideline_id keeps it)
+                prior = guideline_id_to_file.setdefault(gid, name)
+                if prior != name:
+                    errors.append(f"Duplicate guideline_id '{gid}' - also in {prior}")
                     is_valid = False
-                else:
-                    all_guideline_ids.add(gid)
-                    guideline_id_to_file[gid] = path.name
                 
                 # Track per-context decisions
-                if schema_version in per_context_versions:
+                if schema_version in PER_CONTEXT_VERSIONS:
                     v2_count += 1
-                    ar = data.get("all_rust", {})
-                    sr = data.get("safe_rust", {})
-                    
-                    if ar.get("decision"):
-                        all_rust_decided.add(gid)
-                    if sr.get("decision"):
-                        safe_rust_decided.add(gid)
-                    if ar.get("decision") and sr.get("decision"):
-                        both_decided.add(gid)
                 else:
                     v1_count += 1
-                    # v1.x: single decision applies to both
-                    if data.get("decision"):
-                        all_rust_decided.add(gid)
-                        safe_rust_decided.add(gid)
-                        both_decided.add(gid)
+                
+                if summary["all_rust_decided"]:
+                    all_rust_decided.add(gid)
+                if summary["safe_rust_decided"]:
+                    safe_rust_decided.add(gid)
+                if summary["all_rust_decided"] and summary["safe_rust_decided"]:
+                    both_decided.add(gid)
         
         if is_valid:
             valid_count += 1
         else:
             invalid_count += 1
-            errors_by_file.append((path.name, errors))
+            errors_by_file.append((name, errors))
     
     return {
         "valid_count": valid_count,
         "invalid_count": invalid_count,
         "errors_by_file": errors_by_file,
-        "guideline_ids": all_guideline_ids,
+        "guideline_ids": set(guideline_id_to_file),
         "all_rust_decided": all_rust_decided,
         "safe_rust_decided": safe_rust_decided,
         "both_decided": both_decided,
         "v1_count": v1_count,
         "v2_count": v2_count,
         "version_counts": version_counts,
+        "batch_guideline_ids": batch_guideline_ids,
     }
 
 
@@ -286,6 +426,11 @@ def main():
         action="store_true",
         help="Show details for valid files too",
     )
+    parser.add_argument(
+        "--fast-fail",
+        action="store_true",
+        help="Report only the filename error for misnamed files, skipping their other checks",
+    )
     
     args = parser.parse_args()
     
@@ -318,7 +463,9 @@ def main():
     print(f"Validating decisions in {decisions_dir}")
     print()
     
-    result = validate_decisions_directory(decisions_dir, schema, batch_report_path)
+    result = validate_decisions_directory(
+        decisions_dir, schema, batch_report_path, fast_fail=args.fast_fail
+    )
     
     valid_count = result["valid_count"]
     invalid_count = result["invalid_count"]
@@ -352,33 +499,32 @@ def main():
         print()
     
     if errors_by_file:
-        print("Validation errors:")
+        # One write for the whole listing; it can run to thousands of lines
+        lines = ["Validation errors:"]
         for filename, errors in errors_by_file:
-            print(f"  {filename}:")
-            for error in errors:
-                print(f"    - {error}")
+            lines.append(f"  {filename}:")
+            lines.extend(f"    - {error}" for error in errors)
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Cross-reference with batch report (already loaded for validation)
+    batch_guidelines = result["batch_guideline_ids"]
+    if batch_guidelines is not None:
+        missing = batch_guidelines - guideline_ids
+        extra = guideline_ids - batch_guidelines
+        
+        print("Cross-reference with batch report:")
+        print(f"  Batch guidelines: {len(batch_guidelines)}")
+        print(f"  Decisions found: {len(guideline_ids)}")
+        print(f"  Coverage: {len(guideline_ids)}/{len(batch_guidelines)} ({100*len(guideline_ids)/len(batch_guidelines):.0f}%)")
+        if missing:
+            print(f"  Pending: {len(missing)} guidelines")
+            if len(missing) <= 10:
+                print(f"    {', '.join(sorted(missing))}")
+        if extra:
+            print(f"  Extra (not in batch): {len(extra)}")
         print()
     
-    # Cross-reference with batch report
-    if batch_report_path and batch_report_path.exists():
-        batch_report = load_json(batch_report_path)
-        if batch_report:
-            batch_guidelines = {g["guideline_id"] for g in batch_report.get("guidelines", [])}
-            missing = batch_guidelines - guideline_ids
-            extra = guideline_ids - batch_guidelines
-            
-            print("Cross-reference with batch report:")
-            print(f"  Batch guidelines: {len(batch_guidelines)}")
-            print(f"  Decisions found: {len(guideline_ids)}")
-            print(f"  Coverage: {len(guideline_ids)}/{len(batch_guidelines)} ({100*len(guideline_ids)/len(batch_guidelines):.0f}%)")
-            if missing:
-                print(f"  Pending: {len(missing)} guidelines")
-                if len(missing) <= 10:
-                    print(f"    {', '.join(sorted(missing))}")
-            if extra:
-                print(f"  Extra (not in batch): {len(extra)}")
-            print()
-    
     # Summary
     print("Summary:")
     print(f"  Valid: {valid_count}/{total_count}")
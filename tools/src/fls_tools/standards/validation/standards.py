@@ -21,18 +21,28 @@ Exit Codes:
 """
 
 import argparse
+import hashlib
 import json
-import re
+import os
+import pickle
 import sys
 from pathlib import Path
 from typing import Any
 
 import jsonschema
 
+try:
+    # Optional Rust-backed validator, used for the pass/fail check only
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
 from fls_tools.shared import (
     get_project_root,
     get_coding_standards_dir,
     get_tools_dir,
+    get_fls_ids_cache_path,
+    get_standards_validation_cache_path,
     get_guideline_schema_version,
     is_v1,
     is_v2,
@@ -40,6 +50,7 @@ from fls_tools.shared import (
     count_matches_by_category,
     validate_paragraph_coverage,
     has_paragraph_coverage_fields,
+    scan_rst_fls_ids,
 )
 
 # Use shared path utilities to get correct paths
@@ -52,6 +63,14 @@ TOOLS_DATA_DIR = get_tools_dir() / "data"
 FLS_MAPPING_PATH = TOOLS_DATA_DIR / "fls_section_mapping.json"
 FLS_RST_DIR = ROOT_DIR / "cache" / "repos" / "fls" / "src"
 SYNTHETIC_IDS_PATH = TOOLS_DATA_DIR / "synthetic_fls_ids.json"
+FLS_IDS_CACHE_PATH = get_fls_ids_cache_path(ROOT_DIR)
+VALIDATION_CACHE_PATH = get_standards_validation_cache_path(ROOT_DIR)
+
+# Bump when FLS ID extraction changes so existing caches are ignored
+FLS_IDS_CACHE_VERSION = 1
+
+# Bump when validation checks change so cached passing results are ignored
+VALIDATION_CACHE_VERSION = 2
 
 # Schema file names
 RULES_SCHEMA = "coding_standard_rules.schema.json"
@@ -59,23 +78,19 @@ MAPPING_SCHEMA = "fls_mapping.schema.json"
 
 
 def load_json(path: Path) -> dict:
-    """Load a JSON file."""
-    with open(path) as f:
-        return json.load(f)
+    """Load a JSON file.
+    
+    Not memoized: each file is parsed at most once per run (the coverage
+    check reuses guideline IDs from validation), so a cache would only keep
+    parsed trees alive.
+    """
+    # Parse from bytes: json detects UTF-8 itself and skips the text-mode reader
+    return json.loads(path.read_bytes())
 
 
 def load_native_fls_ids_from_rst() -> set[str]:
     """Load all FLS IDs from the FLS RST source files."""
-    ids = set()
-    if not FLS_RST_DIR.exists():
-        return ids
-
-    for rst_file in FLS_RST_DIR.glob("*.rst"):
-        content = rst_file.read_text()
-        # Match FLS ID anchors like .. _fls_abc123:
-        ids.update(re.findall(r'fls_[a-zA-Z0-9]+', content))
-
-    return ids
+    return scan_rst_fls_ids(FLS_RST_DIR)
 
 
 def load_synthetic_fls_ids() -> set[str]:
@@ -93,42 +108,133 @@ def load_fls_ids_from_mapping() -> set[str]:
         print(f"Warning: FLS section mapping not found at {FLS_MAPPING_PATH}")
         return set()
 
-    fls_data = load_json(FLS_MAPPING_PATH)
     fls_ids = set()
 
-    def extract_ids(obj: Any) -> None:
-        """Recursively extract FLS IDs from the mapping."""
-        if isinstance(obj, dict):
-            if "fls_id" in obj and obj["fls_id"]:
-                # Skip synthetic IDs marked with special prefix
-                if not obj["fls_id"].startswith("fls_extracted"):
-                    fls_ids.add(obj["fls_id"])
-            for value in obj.values():
-                extract_ids(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                extract_ids(item)
-
-    extract_ids(fls_data)
+    def collect_id(obj: dict) -> None:
+        """Record an object's FLS ID as it is parsed, then discard the object."""
+        fls_id = obj.get("fls_id")
+        # Skip synthetic IDs marked with special prefix
+        if fls_id and not fls_id.startswith("fls_extracted"):
+            fls_ids.add(fls_id)
+
+    # The hook sees every object bottom-up; returning None means the parsed
+    # tree is never kept or walked
+    json.loads(FLS_MAPPING_PATH.read_bytes(), object_hook=collect_id)
     return fls_ids
 
 
-def load_all_valid_fls_ids() -> tuple[set[str], set[str], set[str]]:
+def fls_id_sources_key() -> str:
+    """Fingerprint the FLS ID sources (RST files, synthetic IDs, section mapping).
+    
+    Uses each file's path, mtime and size, so no file is read.
+    """
+    rst_files = sorted(FLS_RST_DIR.glob("*.rst")) if FLS_RST_DIR.exists() else []
+    stamps = [FLS_IDS_CACHE_VERSION]
+    for path in [*rst_files, SYNTHETIC_IDS_PATH, FLS_MAPPING_PATH]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            stamps.append((str(path), None))
+        else:
+            stamps.append((str(path), st.st_mtime_ns, st.st_size))
+    return hashlib.blake2b(repr(stamps).encode()).hexdigest()
+
+
+def load_fls_ids_cache(key: str) -> tuple[set[str], set[str], set[str]] | None:
+    """Load cached FLS ID sets if they were computed from the sources `key` describes."""
+    if not FLS_IDS_CACHE_PATH.exists():
+        return None
+    try:
+        with open(FLS_IDS_CACHE_PATH, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        return None
+    if cached.get("key") != key:
+        return None
+    return cached["ids"]
+
+
+def _dump_pickle_atomically(path: Path, obj: Any) -> None:
+    """Pickle `obj` to `path` via a temporary file, so readers never see a partial cache."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def save_fls_ids_cache(key: str, ids: tuple[set[str], set[str], set[str]]) -> None:
+    """Save FLS ID sets along with the key of the sources they came from."""
+    _dump_pickle_atomically(FLS_IDS_CACHE_PATH, {"key": key, "ids": ids})
+
+
+def load_all_valid_fls_ids(use_cache: bool = True) -> tuple[set[str], set[str], set[str]]:
     """Load all valid FLS IDs from all sources.
     
+    With `use_cache`, the sets are reused from FLS_IDS_CACHE_PATH while no
+    source file has changed (by mtime and size), skipping the RST scan.
+    
     Returns:
         Tuple of (native_ids, synthetic_ids, mapping_ids)
     """
+    if use_cache:
+        key = fls_id_sources_key()
+        cached = load_fls_ids_cache(key)
+        if cached is not None:
+            if not FLS_MAPPING_PATH.exists():
+                print(f"Warning: FLS section mapping not found at {FLS_MAPPING_PATH}")
+            return cached
+    
     native_ids = load_native_fls_ids_from_rst()
     synthetic_ids = load_synthetic_fls_ids()
     mapping_ids = load_fls_ids_from_mapping()
+    
+    if use_cache:
+        save_fls_ids_cache(key, (native_ids, synthetic_ids, mapping_ids))
     return native_ids, synthetic_ids, mapping_ids
 
 
-def validate_schema(data: dict, schema: dict, filename: str) -> list[str]:
-    """Validate data against a JSON schema. Returns list of errors."""
+class SchemaValidator:
+    """Draft 2020-12 validator for one schema, built once and reused across files.
+    
+    When jsonschema-rs is installed it decides whether a document is valid;
+    python-jsonschema only runs for invalid documents, so error messages are
+    the same with or without the accelerator. (fastjsonschema is not used as
+    an accelerator: it implements drafts 4-7, not the 2020-12 drafts these
+    schemas declare, so its verdicts could disagree.)
+    """
+
+    def __init__(self, schema: dict):
+        self.validator = jsonschema.Draft202012Validator(schema)
+        self.fast_validator = (
+            jsonschema_rs.Draft202012Validator(schema) if jsonschema_rs is not None else None
+        )
+
+    def iter_errors(self, data: Any):
+        """Yield python-jsonschema errors for `data` (none if it is valid)."""
+        # Only the Rust validator gets an is_valid() pre-check: python-jsonschema's
+        # is_valid() is the same lazy iter_errors() walk, so it would save nothing
+        # on valid documents and walk invalid ones twice
+        if self.fast_validator is not None and self.fast_validator.is_valid(data):
+            return iter(())
+        return self.validator.iter_errors(data)
+
+
+def validate_schema(
+    data: dict,
+    schema: dict | SchemaValidator,
+    filename: str,
+) -> list[str]:
+    """Validate data against a JSON schema. Returns list of errors.
+    
+    `schema` may be the schema dict or a prebuilt SchemaValidator; pass a
+    validator when checking many files against the same schema.
+    """
     errors = []
-    validator = jsonschema.Draft202012Validator(schema)
+    validator = SchemaValidator(schema) if isinstance(schema, dict) else schema
 
     for error in validator.iter_errors(data):
         path = " -> ".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
@@ -137,6 +243,50 @@ def validate_schema(data: dict, schema: dict, filename: str) -> list[str]:
     return errors
 
 
+# Schema versions by layout (frozensets: membership is tested per entry)
+V1_VERSIONS = frozenset({"1.0", "1.1", "1.2"})
+PER_CONTEXT_VERSIONS = frozenset({"2.0", "2.1", "2.2", "3.0", "3.1", "3.2", "4.0"})
+
+# Enriched versions (1.1+, 2.1+, 3.x, 4.x) expected to carry ADD-6 data
+ADD6_VERSIONS = frozenset({"1.1", "1.2", "2.1", "2.2", "3.0", "3.1", "3.2", "4.0"})
+
+
+def check_mapping_fls_ids(
+    mapping: dict,
+    schema_version: str,
+    valid_fls_ids: set[str],
+    filename: str,
+    errors: list[str],
+) -> None:
+    """Append an error for each unknown FLS ID in one mapping entry."""
+    guideline_id = mapping.get("guideline_id", "unknown")
+
+    def check_matches(matches: list, location: str) -> None:
+        """Helper to check FLS IDs in a matches array."""
+        # IDs are not sys.intern()ed before the lookup: interning is itself a
+        # hash-table probe and roughly doubles the cost of this check
+        for match in matches:
+            fls_id = match.get("fls_id")
+            if fls_id and fls_id not in valid_fls_ids:
+                errors.append(f"{filename}: {guideline_id}: Unknown FLS ID '{fls_id}' in {location}")
+
+    if schema_version in V1_VERSIONS:
+        # v1.x: Check flat structure
+        for fls_id in mapping.get("fls_ids", []):
+            if fls_id not in valid_fls_ids:
+                errors.append(f"{filename}: {guideline_id}: Unknown FLS ID '{fls_id}' in fls_ids")
+        
+        check_matches(mapping.get("accepted_matches", []), "accepted_matches")
+        check_matches(mapping.get("rejected_matches", []), "rejected_matches")
+    
+    elif schema_version in PER_CONTEXT_VERSIONS:
+        # v2.x/v3.x/v4.x: Check per-context structure
+        for context in ["all_rust", "safe_rust"]:
+            ctx_data = mapping.get(context, {})
+            check_matches(ctx_data.get("accepted_matches", []), f"{context}.accepted_matches")
+            check_matches(ctx_data.get("rejected_matches", []), f"{context}.rejected_matches")
+
+
 def validate_fls_ids(data: dict, valid_fls_ids: set[str], filename: str) -> list[str]:
     """Validate that all FLS IDs in a mapping file are valid.
     
@@ -149,64 +299,53 @@ def validate_fls_ids(data: dict, valid_fls_ids: set[str], filename: str) -> list
     """
     errors = []
 
-    if "mappings" not in data:
-        return errors
+    for mapping in data.get("mappings", []):
+        check_mapping_fls_ids(
+            mapping, get_guideline_schema_version(mapping), valid_fls_ids, filename, errors
+        )
 
-    # Per-context versions
-    per_context_versions = ("2.0", "2.1", "2.2", "3.0", "3.1", "3.2", "4.0")
+    return errors
 
-    def check_matches(matches: list, location: str, guideline_id: str) -> None:
-        """Helper to check FLS IDs in a matches array."""
-        for match in matches:
-            fls_id = match.get("fls_id")
-            if fls_id and fls_id not in valid_fls_ids:
-                errors.append(f"{filename}: {guideline_id}: Unknown FLS ID '{fls_id}' in {location}")
 
-    for mapping in data["mappings"]:
-        guideline_id = mapping.get("guideline_id", "unknown")
-        schema_version = get_guideline_schema_version(mapping)
-        
-        if schema_version in ("1.0", "1.1", "1.2"):
-            # v1.x: Check flat structure
-            fls_ids = mapping.get("fls_ids", [])
-            for fls_id in fls_ids:
-                if fls_id not in valid_fls_ids:
-                    errors.append(f"{filename}: {guideline_id}: Unknown FLS ID '{fls_id}' in fls_ids")
-            
-            check_matches(mapping.get("accepted_matches", []), "accepted_matches", guideline_id)
-            check_matches(mapping.get("rejected_matches", []), "rejected_matches", guideline_id)
-        
-        elif schema_version in per_context_versions:
-            # v2.x/v3.x/v4.x: Check per-context structure
-            for context in ["all_rust", "safe_rust"]:
-                ctx_data = mapping.get(context, {})
-                check_matches(ctx_data.get("accepted_matches", []), f"{context}.accepted_matches", guideline_id)
-                check_matches(ctx_data.get("rejected_matches", []), f"{context}.rejected_matches", guideline_id)
+def standard_guideline_ids(standards_data: dict) -> set:
+    """Get all guideline IDs from a standards file."""
+    return {
+        g.get("id")
+        for cat in standards_data.get("categories", [])
+        for g in cat.get("guidelines", [])
+    }
 
-    return errors
 
+def mapped_guideline_ids(mapping_data: dict) -> set:
+    """Get all guideline IDs from a mapping file."""
+    return {m.get("guideline_id") for m in mapping_data.get("mappings", [])}
 
-def validate_standards_file(filepath: Path, schema: dict) -> tuple[list[str], dict]:
+
+def validate_standards_file(
+    filepath: Path, schema: dict | SchemaValidator
+) -> tuple[list[str], dict]:
     """Validate a standards file and return errors and statistics."""
     data = load_json(filepath)
     errors = validate_schema(data, schema, filepath.name)
 
     # Compute statistics for verification
+    categories = data.get("categories", [])
     stats = {
         "standard": data.get("standard", "unknown"),
         "version": data.get("version", "unknown"),
-        "categories": len(data.get("categories", [])),
-        "guidelines": sum(
-            len(cat.get("guidelines", []))
-            for cat in data.get("categories", [])
-        ),
+        "categories": len(categories),
+        "guidelines": sum(len(cat.get("guidelines", [])) for cat in categories),
+        # Kept for check_guideline_coverage so the file is not parsed again
+        "guideline_ids": standard_guideline_ids(data),
     }
 
     return errors, stats
 
 
 def validate_mapping_file(
-    filepath: Path, schema: dict, valid_fls_ids: set[str]
+    filepath: Path,
+    schema: dict | SchemaValidator,
+    valid_fls_ids: set[str],
 ) -> tuple[list[str], dict, list[str]]:
     """Validate a mapping file and return errors, statistics, and warnings.
     
@@ -218,10 +357,7 @@ def validate_mapping_file(
     data = load_json(filepath)
     errors = validate_schema(data, schema, filepath.name)
     warnings = []
-
-    # Validate FLS IDs
-    fls_errors = validate_fls_ids(data, valid_fls_ids, filepath.name)
-    errors.extend(fls_errors)
+    filename = filepath.name
 
     # Compute statistics for both applicability dimensions
     mappings = data.get("mappings", [])
@@ -233,13 +369,9 @@ def validate_mapping_file(
         "3.0": 0, "3.1": 0, "3.2": 0,
         "4.0": 0,
     }
-    for m in mappings:
-        v = get_guideline_schema_version(m)
-        if v in version_counts:
-            version_counts[v] += 1
     
     # Count entries with ADD-6 data
-    add6_count = sum(1 for m in mappings if has_add6_data(m))
+    add6_count = 0
     
     # Count paragraph coverage
     para_stats = {
@@ -250,21 +382,57 @@ def validate_mapping_file(
         "coverage_errors": 0,
     }
     
-    # Warn if enriched versions (1.1+, 2.1+, 3.x, 4.x) are missing ADD-6 data
-    add6_versions = ("1.1", "1.2", "2.1", "2.2", "3.0", "3.1", "3.2", "4.0")
+    # Applicability tallies: v1.x flat fields and v2.x+ per-context values
+    v1_applicability_fields = {
+        "all_rust": "applicability_all_rust",
+        "safe_rust": "applicability_safe_rust",
+    }
+    v1_applicability = {
+        context: {"direct": 0, "partial": 0, "not_applicable": 0, "rust_prevents": 0, "unmapped": 0}
+        for context in v1_applicability_fields
+    }
+    v2_applicability = {
+        context: {"yes": 0, "no": 0, "partial": 0}
+        for context in ("all_rust", "safe_rust")
+    }
+    
+    # Single pass: FLS ID checks, version/ADD-6/applicability counts and
+    # paragraph coverage
     for m in mappings:
+        # Detect the version once and reuse it for every check below
         v = get_guideline_schema_version(m)
         gid = m.get("guideline_id", "unknown")
         
-        if v in add6_versions and not has_add6_data(m):
-            warnings.append(f"{filepath.name}: {gid}: v{v} entry missing misra_add6 block")
+        # Validate FLS IDs
+        check_mapping_fls_ids(m, v, valid_fls_ids, filename, errors)
+        
+        if v in version_counts:
+            version_counts[v] += 1
+        
+        if v in V1_VERSIONS:
+            for context, field in v1_applicability_fields.items():
+                counts = v1_applicability[context]
+                app = m.get(field)
+                if app in counts:
+                    counts[app] += 1
+        elif v in PER_CONTEXT_VERSIONS:
+            for context, counts in v2_applicability.items():
+                app = m.get(context, {}).get("applicability", "no")
+                if app in counts:
+                    counts[app] += 1
+        
+        if has_add6_data(m):
+            add6_count += 1
+        elif v in ADD6_VERSIONS:
+            # Warn if enriched versions are missing ADD-6 data
+            warnings.append(f"{filename}: {gid}: v{v} entry missing misra_add6 block")
         
         # Validate paragraph coverage
         para_errors = validate_paragraph_coverage(m, strict=False)
         if para_errors:
             para_stats["coverage_errors"] += 1
             for err in para_errors:
-                warnings.append(f"{filepath.name}: {gid}: {err}")
+                warnings.append(f"{filename}: {gid}: {err}")
         
         # Count paragraph coverage categories
         if has_paragraph_coverage_fields(m):
@@ -294,33 +462,8 @@ def validate_mapping_file(
             if has_waiver:
                 para_stats["has_waiver"] += 1
     
-    v1_versions = ("1.0", "1.1", "1.2")
-    v2_versions = ("2.0", "2.1", "2.2", "3.0", "3.1", "3.2", "4.0")
-    
-    def count_v1_applicability(field: str) -> dict[str, int]:
-        """Count v1.x applicability values for a given field."""
-        v1_mappings = [m for m in mappings if get_guideline_schema_version(m) in v1_versions]
-        return {
-            "direct": sum(1 for m in v1_mappings if m.get(field) == "direct"),
-            "partial": sum(1 for m in v1_mappings if m.get(field) == "partial"),
-            "not_applicable": sum(1 for m in v1_mappings if m.get(field) == "not_applicable"),
-            "rust_prevents": sum(1 for m in v1_mappings if m.get(field) == "rust_prevents"),
-            "unmapped": sum(1 for m in v1_mappings if m.get(field) == "unmapped"),
-        }
-    
-    def count_v2_applicability(context: str) -> dict[str, int]:
-        """Count v2.x+ applicability values for a given context."""
-        v2_mappings = [m for m in mappings if get_guideline_schema_version(m) in v2_versions]
-        counts = {"yes": 0, "no": 0, "partial": 0}
-        for m in v2_mappings:
-            ctx = m.get(context, {})
-            app = ctx.get("applicability", "no")
-            if app in counts:
-                counts[app] += 1
-        return counts
-    
-    v1_total = sum(version_counts.get(v, 0) for v in v1_versions)
-    v2_total = sum(version_counts.get(v, 0) for v in v2_versions)
+    v1_total = sum(version_counts.get(v, 0) for v in V1_VERSIONS)
+    v2_total = sum(version_counts.get(v, 0) for v in PER_CONTEXT_VERSIONS)
     
     stats = {
         "standard": data.get("standard", "unknown"),
@@ -329,37 +472,92 @@ def validate_mapping_file(
         "v1_count": v1_total,
         "v2_count": v2_total,
         "add6_count": add6_count,
+        # Kept for check_guideline_coverage so the file is not parsed again
+        "guideline_ids": mapped_guideline_ids(data),
         "paragraph_coverage": para_stats,
-        "all_rust": count_v1_applicability("applicability_all_rust"),
-        "safe_rust": count_v1_applicability("applicability_safe_rust"),
+        "all_rust": v1_applicability["all_rust"],
+        "safe_rust": v1_applicability["safe_rust"],
     }
     
     # Add v2 stats if any v2+ entries exist
     if v2_total > 0:
-        stats["all_rust_v2"] = count_v2_applicability("all_rust")
-        stats["safe_rust_v2"] = count_v2_applicability("safe_rust")
+        stats["all_rust_v2"] = v2_applicability["all_rust"]
+        stats["safe_rust_v2"] = v2_applicability["safe_rust"]
 
     return errors, stats, warnings
 
 
-def check_guideline_coverage(standards_file: Path, mapping_file: Path) -> list[str]:
-    """Check that all guidelines in a standards file have mapping entries."""
+def validation_cache_key(
+    filepath: Path, schema_path: Path, fls_ids_key: str | None = None
+) -> tuple:
+    """Identify a file's validation inputs by the mtime and size of it and its schema.
+    
+    Mapping files also pass the fls_id_sources_key(), since their result
+    depends on the valid FLS IDs.
+    """
+    file_stat = filepath.stat()
+    schema_stat = schema_path.stat()
+    return (
+        VALIDATION_CACHE_VERSION,
+        file_stat.st_mtime_ns, file_stat.st_size,
+        schema_stat.st_mtime_ns, schema_stat.st_size,
+        fls_ids_key,
+    )
+
+
+def load_validation_cache() -> dict[str, tuple[tuple, tuple]]:
+    """Load path -> (key, result) for files that passed, or start empty if missing or unreadable."""
+    if not VALIDATION_CACHE_PATH.exists():
+        return {}
+    try:
+        with open(VALIDATION_CACHE_PATH, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return {}
+
+
+def save_validation_cache(cache: dict[str, tuple[tuple, tuple]]) -> None:
+    """Save the results of files that passed validation."""
+    _dump_pickle_atomically(VALIDATION_CACHE_PATH, cache)
+
+
+def get_cached_result(cache: dict, filepath: Path, key: tuple) -> tuple | None:
+    """Return the cached result for a file if its inputs are unchanged."""
+    entry = cache.get(str(filepath))
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    return None
+
+
+def record_result(cache: dict, filepath: Path, key: tuple, result: tuple) -> None:
+    """Cache a result if the file passed (errors come first), otherwise drop it."""
+    if result[0]:
+        cache.pop(str(filepath), None)
+    else:
+        cache[str(filepath)] = (key, result)
+
+
+def check_guideline_coverage(
+    standards_file: Path,
+    mapping_file: Path,
+    standard_ids: set | None = None,
+    mapped_ids: set | None = None,
+) -> list[str]:
+    """Check that all guidelines in a standards file have mapping entries.
+    
+    `standard_ids` and `mapped_ids` are the files' guideline IDs when the
+    caller already has them (from validation stats); otherwise the files
+    are loaded.
+    """
     errors = []
 
     if not standards_file.exists() or not mapping_file.exists():
         return errors
 
-    standards_data = load_json(standards_file)
-    mapping_data = load_json(mapping_file)
-
-    # Get all guideline IDs from standards file
-    standard_ids = set()
-    for cat in standards_data.get("categories", []):
-        for g in cat.get("guidelines", []):
-            standard_ids.add(g.get("id"))
-
-    # Get all guideline IDs from mapping file
-    mapped_ids = {m.get("guideline_id") for m in mapping_data.get("mappings", [])}
+    if standard_ids is None:
+        standard_ids = standard_guideline_ids(load_json(standards_file))
+    if mapped_ids is None:
+        mapped_ids = mapped_guideline_ids(load_json(mapping_file))
 
     # Find missing mappings
     missing = standard_ids - mapped_ids
@@ -401,6 +599,17 @@ def main():
         action="store_true",
         help="Check that all guidelines have mapping entries",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan FLS ID sources instead of using the cached ID sets",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Reuse the results of files that passed last time and are unchanged "
+             "(by mtime and size), along with their schema and FLS ID sources",
+    )
     args = parser.parse_args()
 
     # Load schemas
@@ -414,11 +623,12 @@ def main():
         print(f"Error: Mapping schema not found at {mapping_schema_path}")
         sys.exit(1)
 
-    rules_schema = load_json(rules_schema_path)
-    mapping_schema = load_json(mapping_schema_path)
+    # Build each validator once and reuse it for every file
+    rules_validator = SchemaValidator(load_json(rules_schema_path))
+    mapping_validator = SchemaValidator(load_json(mapping_schema_path))
 
     # Load valid FLS IDs from all sources
-    native_ids, synthetic_ids, mapping_ids = load_all_valid_fls_ids()
+    native_ids, synthetic_ids, mapping_ids = load_all_valid_fls_ids(use_cache=not args.no_cache)
     valid_fls_ids = native_ids | synthetic_ids
     print(f"Loaded FLS IDs:")
     print(f"  Native (from RST):     {len(native_ids)}")
@@ -429,6 +639,12 @@ def main():
     all_errors = []
     schema_errors = []
     fls_errors = []
+    
+    # Results of files that passed last time, reused with --skip-unchanged
+    validation_cache = load_validation_cache() if args.skip_unchanged else {}
+    
+    # Guideline IDs of each validated file, reused by the coverage check
+    guideline_ids = {}
 
     # Validate standards files
     if not args.mappings_only:
@@ -443,7 +659,18 @@ def main():
 
         for filepath in sorted(standards_files):
             print(f"\n  {filepath.name}:")
-            errors, stats = validate_standards_file(filepath, rules_schema)
+            cached = None
+            if args.skip_unchanged:
+                key = validation_cache_key(filepath, rules_schema_path)
+                cached = get_cached_result(validation_cache, filepath, key)
+            if cached is not None:
+                errors, stats = cached
+            else:
+                errors, stats = validate_standards_file(filepath, rules_validator)
+                if args.skip_unchanged:
+                    record_result(validation_cache, filepath, key, (errors, stats))
+            cached_note = " (cached)" if cached is not None else ""
+            guideline_ids[filepath] = stats["guideline_ids"]
 
             if errors:
                 schema_errors.extend(errors)
@@ -453,7 +680,7 @@ def main():
                 if len(errors) > 5:
                     print(f"      ... and {len(errors) - 5} more")
             else:
-                print(f"    OK - {stats['standard']} {stats['version']}")
+                print(f"    OK{cached_note} - {stats['standard']} {stats['version']}")
                 print(f"       {stats['categories']} categories, {stats['guidelines']} guidelines")
 
     # Validate mapping files
@@ -470,10 +697,32 @@ def main():
         if not mapping_files:
             print("\n  No mapping files found (expected in mappings/ directory)")
         else:
+            mapping_files = sorted(mapping_files)
+            
+            results = {}
+            keys = {}
+            if args.skip_unchanged:
+                fls_ids_key = fls_id_sources_key()
+                for filepath in mapping_files:
+                    keys[filepath] = validation_cache_key(filepath, mapping_schema_path, fls_ids_key)
+                    cached = get_cached_result(validation_cache, filepath, keys[filepath])
+                    if cached is not None:
+                        results[filepath] = cached
+            cached_files = set(results)
+            to_validate = [f for f in mapping_files if f not in cached_files]
+            
+            for filepath in to_validate:
+                result = validate_mapping_file(filepath, mapping_validator, valid_fls_ids)
+                results[filepath] = result
+                if args.skip_unchanged:
+                    record_result(validation_cache, filepath, keys[filepath], result)
+            
             all_warnings = []
-            for filepath in sorted(mapping_files):
+            for filepath in mapping_files:
+                errors, stats, warnings = results[filepath]
+                cached_note = " (cached)" if filepath in cached_files else ""
+                guideline_ids[filepath] = stats["guideline_ids"]
                 print(f"\n  {filepath.name}:")
-                errors, stats, warnings = validate_mapping_file(filepath, mapping_schema, valid_fls_ids)
                 all_warnings.extend(warnings)
 
                 schema_err = [e for e in errors if "Unknown FLS ID" not in e]
@@ -497,7 +746,7 @@ def main():
                         print(f"      - {w}")
 
                 if not errors:
-                    print(f"    OK - {stats['standard']} ({stats['total']} guidelines)")
+                    print(f"    OK{cached_note} - {stats['standard']} ({stats['total']} guidelines)")
                     
                     # Show version breakdown
                     vc = stats.get("version_counts", {})
@@ -576,7 +825,10 @@ def main():
 
         for standards_file, mapping_file in coverage_pairs:
             if standards_file.exists() and mapping_file.exists():
-                errors = check_guideline_coverage(standards_file, mapping_file)
+                errors = check_guideline_coverage(
+                    standards_file, mapping_file,
+                    guideline_ids.get(standards_file), guideline_ids.get(mapping_file),
+                )
                 if errors:
                     all_errors.extend(errors)
                     print(f"\n  {mapping_file.name}: {len(errors)} coverage issues")
@@ -585,6 +837,9 @@ def main():
                 else:
                     print(f"\n  {mapping_file.name}: Full coverage")
 
+    if args.skip_unchanged:
+        save_validation_cache(validation_cache)
+
     # Summary
     print("\n" + "=" * 60)
     print("Summary")
@@ -19,6 +19,8 @@ import re
 import sys
 from pathlib import Path
 
+from fls_tools.shared import scan_rst_fls_ids
+
 # Project paths
 TOOLS_DIR = Path(__file__).parent
 PROJECT_ROOT = TOOLS_DIR.parent
@@ -38,34 +40,27 @@ def load_json(path: Path) -> dict:
 
 
 def collect_ids_from_mapping(mapping: dict) -> set[str]:
-    """Recursively collect all FLS IDs from fls_section_mapping.json."""
+    """Collect all FLS IDs from fls_section_mapping.json, at any depth."""
     ids = set()
     
-    def _collect(obj):
+    # Explicit stack: no call per node and no recursion limit
+    stack = [mapping]
+    while stack:
+        obj = stack.pop()
         if isinstance(obj, dict):
-            if 'fls_id' in obj and obj['fls_id']:
-                ids.add(obj['fls_id'])
-            for v in obj.values():
-                _collect(v)
+            fls_id = obj.get('fls_id')
+            if fls_id:
+                ids.add(fls_id)
+            stack.extend(obj.values())
         elif isinstance(obj, list):
-            for item in obj:
-                _collect(item)
+            stack.extend(obj)
     
-    _collect(mapping)
     return ids
 
 
 def collect_native_ids_from_rst(rst_dir: Path) -> set[str]:
     """Collect all FLS IDs from the FLS RST source files."""
-    ids = set()
-    if not rst_dir.exists():
-        return ids
-    
-    for rst_file in rst_dir.glob("*.rst"):
-        content = rst_file.read_text()
-        ids.update(re.findall(r'fls_[a-zA-Z0-9]+', content))
-    
-    return ids
+    return scan_rst_fls_ids(rst_dir)
 
 
 def collect_coding_standard_mapping_ids(mappings_dir: Path) -> dict[str, set[str]]:
@@ -43,8 +43,6 @@ from copy import deepcopy
 from datetime import date
 from pathlib import Path
 
-import jsonschema
-
 from fls_tools.shared import (
     get_project_root,
     get_standard_mappings_path,
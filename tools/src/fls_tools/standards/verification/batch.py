@@ -86,6 +86,9 @@ def validate_batch_report(report: dict, schema: dict | None) -> list[str]:
     """
     Validate a batch report against the schema.
     
+    Runs once per generated report with python-jsonschema; fastjsonschema
+    cannot stand in here since it stops at draft-07 and the schema is 2020-12.
+    
     Returns a list of validation errors (empty if valid).
     """
     if schema is None:
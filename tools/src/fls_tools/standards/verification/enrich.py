@@ -28,7 +28,6 @@ Usage:
 
 import argparse
 import json
-import pickle
 import sys
 from pathlib import Path
 
@@ -48,6 +47,9 @@ from fls_tools.shared import (
     PathOutsideProjectError,
     CATEGORY_NAMES,
     VALID_STANDARDS,
+    decode_embeddings,
+    embeddings_exist,
+    read_embeddings_file,
 )
 
 
@@ -58,16 +60,15 @@ ENRICH_PARAGRAPH_THRESHOLD = 0.30
 
 def load_embeddings(embeddings_path: Path) -> tuple[list[str], np.ndarray, dict]:
     """Load embeddings from pickle file."""
-    if not embeddings_path.exists():
+    if not embeddings_exist(embeddings_path):
         print(f"ERROR: Embeddings not found: {embeddings_path}", file=sys.stderr)
         sys.exit(1)
     
-    with open(embeddings_path, "rb") as f:
-        data = pickle.load(f)
+    data = read_embeddings_file(embeddings_path)
     
     embed_data = data.get("data", data)
     ids = embed_data.get("ids", [])
-    embeddings = embed_data.get("embeddings", np.array([]))
+    embeddings = decode_embeddings(embed_data)
     id_to_index = embed_data.get("id_to_index", {})
     
     return ids, embeddings, id_to_index
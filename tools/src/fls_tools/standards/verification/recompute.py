@@ -19,7 +19,6 @@ Usage:
 
 import argparse
 import json
-import pickle
 import sys
 from pathlib import Path
 
@@ -35,6 +34,9 @@ from fls_tools.shared import (
     get_fls_paragraph_embeddings_path,
     CATEGORY_NAMES,
     VALID_STANDARDS,
+    decode_embeddings,
+    embeddings_exist,
+    read_embeddings_file,
 )
 
 
@@ -56,17 +58,16 @@ def load_embeddings(path: Path, description: str) -> tuple[list[str], np.ndarray
         embeddings: numpy array of embeddings (N x D)
         id_to_index: Dict mapping FLS ID to index
     """
-    if not path.exists():
+    if not embeddings_exist(path):
         print(f"ERROR: {description} not found: {path}", file=sys.stderr)
         sys.exit(1)
-    with open(path, "rb") as f:
-        data = pickle.load(f)
+    data = read_embeddings_file(path)
     
     # Handle the actual embeddings format
     embed_data = data.get("data", data)
     
     ids = embed_data.get("ids", [])
-    embeddings = embed_data.get("embeddings", np.array([]))
+    embeddings = decode_embeddings(embed_data)
     id_to_index = embed_data.get("id_to_index", {})
     
     return ids, embeddings, id_to_index
@@ -13,7 +13,6 @@ Usage:
 
 import argparse
 import json
-import pickle
 import sys
 from pathlib import Path
 
@@ -29,6 +28,9 @@ from fls_tools.shared import (
     get_misra_rust_applicability_path,
     CATEGORY_NAMES,
     generate_search_id,
+    decode_embeddings,
+    embeddings_exist,
+    read_embeddings_file,
 )
 
 # Rationale code expansions for display
@@ -49,18 +51,17 @@ def load_embeddings(embeddings_path: Path) -> tuple[list[str], np.ndarray, dict]
         embeddings: numpy array of embeddings (N x D)
         id_to_index: Dict mapping FLS ID to index
     """
-    if not embeddings_path.exists():
+    if not embeddings_exist(embeddings_path):
         print(f"ERROR: Embeddings not found: {embeddings_path}", file=sys.stderr)
         sys.exit(1)
     
-    with open(embeddings_path, "rb") as f:
-        data = pickle.load(f)
+    data = read_embeddings_file(embeddings_path)
     
-    # Handle the actual embeddings format: {'data': {'ids': [...], 'embeddings': np.array, 'id_to_index': {...}}}
+    # Handle the actual embeddings format: {'data': {'ids': [...], 'embeddings': np.array}}
     embed_data = data.get("data", data)
     
     ids = embed_data.get("ids", [])
-    embeddings = embed_data.get("embeddings", np.array([]))
+    embeddings = decode_embeddings(embed_data)
     id_to_index = embed_data.get("id_to_index", {})
     
     return ids, embeddings, id_to_index
@@ -369,7 +370,7 @@ def main():
     # Search sections
     if not args.paragraphs_only:
         section_embeddings_path = get_fls_section_embeddings_path(root)
-        if section_embeddings_path.exists():
+        if embeddings_exist(section_embeddings_path):
             print("Searching section embeddings...", file=sys.stderr)
             ids, embeddings, _ = load_embeddings(section_embeddings_path)
             section_results = search_sections(query_embedding, ids, embeddings, sections_metadata, args.top)
@@ -378,7 +379,7 @@ def main():
     # Search paragraphs
     if not args.sections_only:
         paragraph_embeddings_path = get_fls_paragraph_embeddings_path(root)
-        if paragraph_embeddings_path.exists():
+        if embeddings_exist(paragraph_embeddings_path):
             print("Searching paragraph embeddings...", file=sys.stderr)
             ids, embeddings, _ = load_embeddings(paragraph_embeddings_path)
             paragraph_results = search_paragraphs(query_embedding, ids, embeddings, paragraphs_metadata, args.top)
@@ -24,7 +24,6 @@ Usage:
 
 import argparse
 import json
-import pickle
 import sys
 from pathlib import Path
 
@@ -50,6 +49,9 @@ from fls_tools.shared import (
     SEE_ALSO_MAX_MATCHES,
     VALID_STANDARDS,
     generate_search_id,
+    decode_embeddings,
+    embeddings_exist,
+    read_embeddings_file,
 )
 
 # Rationale code expansions for display
@@ -71,16 +73,15 @@ def load_embeddings(path: Path) -> tuple[list[str], np.ndarray, dict, dict]:
         id_to_index: Dict mapping ID to index
         metadata: Dict of metadata (if present)
     """
-    if not path.exists():
+    if not embeddings_exist(path):
         return [], np.array([]), {}, {}
     
-    with open(path, "rb") as f:
-        data = pickle.load(f)
+    data = read_embeddings_file(path)
     
     embed_data = data.get("data", data)
     
     ids = embed_data.get("ids", [])
-    embeddings = embed_data.get("embeddings", np.array([]))
+    embeddings = decode_embeddings(embed_data)
     id_to_index = embed_data.get("id_to_index", {})
     metadata = data.get("metadata", {})
     